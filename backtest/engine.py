@@ -1,8 +1,13 @@
+import asyncio
 import logging
-from queue import Queue, Empty
+from typing import Callable, Deque, Optional
+
+import numpy as np
 
 from models import TradingConfig, MarketEvent
+from models.pool import release_market_event
 from strategies import BaseStrategy
+from strategies.base_strategy import OHLCV_COLUMNS, SIGNAL_CODES
 from data import IDataHandler
 from event_bus import EventBus
 from broker import IBroker
@@ -27,6 +32,7 @@ class BacktestEngine:
             order_manager: IOrderManager,
             broker: IBroker,
             event_bus: EventBus,
+            loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None,
     ) -> None:
         self.config = config
         self.data_handler = data_handler
@@ -35,32 +41,149 @@ class BacktestEngine:
         self.order_manager = order_manager
         self.broker = broker
         self.event_bus = event_bus
+        # Fábrica del bucle de asyncio para el modo asíncrono (p. ej. uvloop.new_event_loop);
+        # None usa el bucle por defecto sin instalar ninguna política global
+        self.loop_factory = loop_factory
 
-        self.data_queue: Queue[MarketEvent] = self.data_handler.events_queue
+        self.data_queue: Optional[Deque[MarketEvent]] = self.data_handler.events_queue
 
         logger.info("BacktestEngine inicializado.")
 
     def run(self) -> None:
         """Ejectua el bucle principal de backtesting."""
+        if self.config.backtesting.async_mode:
+            asyncio.run(self.run_async(), loop_factory=self.loop_factory)
+            return
+
         logger.info("Iniciando backtesting...")
 
+        # Los handlers con cola entregan los MarketEvent sólo por ella; el resto los devuelve
+        uses_events_queue = self.data_handler.uses_events_queue
+
+        # Los MarketEvent sólo se reciclan si el bus lo permite (opt-in, sin historial) y no hay cola
+        recycle_events = self.event_bus.recycle_events and not uses_events_queue
+
         while self.data_handler.continue_backtest:
 
-            # 1. El DataHandler genera un MarketEvent y lo pone en el data_queue
-            self.data_handler.update_bars()
+            # 1. El DataHandler genera el siguiente MarketEvent
+            event = self.data_handler.update_bars()
+
+            # 2. Los handlers con cola (p. ej. con productor propio) entregan sus eventos por ella
+            if uses_events_queue:
+                self._drain_data_queue()
+
+            # 3. Si no, el motor publica el MarketEvent devuelto directamente en el EventBus
+            elif event is not None:
+                logger.debug("Procesando MarketEvent para el símbolo %s en %s", event.symbol, event.timestamp)
+                self.event_bus.publish(event)
+                if recycle_events:
+                    release_market_event(event)
+
+        logger.info("Backtesting finalizado.")
+
+        self.portfolio.print_final_stats()
+
+    def run_vectorized(self) -> None:
+        """
+        Variante para barridos de parámetros: calcula las señales de todas las barras en una sola
+        pasada con strategy.compute_signals y sólo publica eventos en las barras con señal, sin
+        MarketEvent. Señales, órdenes y fills siguen pasando por el EventBus. La estrategia no
+        actualiza su caché de datos de mercado. Si la estrategia o el DataHandler no soportan
+        el modo vectorizado, se usa el bucle por barra.
+        """
+        ohlcv = self.data_handler.get_ohlcv_array(OHLCV_COLUMNS)
+        signals = self.strategy.compute_signals(ohlcv) if ohlcv is not None else None
+        if signals is None:
+            logger.info("Modo vectorizado no soportado por la estrategia o el DataHandler; usando bucle por barra.")
+            self.run()
+            return
+
+        logger.info("Iniciando backtesting (modo vectorizado)...")
+
+        strategy = self.strategy
+        data_handler = self.data_handler
+
+        indices = np.flatnonzero(signals)
+        position = 0
+        for index, code in zip(indices.tolist(), signals[indices].tolist()):
+            # Situar el DataHandler en la barra de la señal para que broker y portfolio lean su precio
+            timestamp = data_handler.advance(index + 1 - position)
+            position = index + 1
+
+            symbol = data_handler.current_symbol
+            if strategy.is_active and symbol in strategy.symbols:
+                strategy.emit_signal(symbol, timestamp, SIGNAL_CODES[code])
 
-            # 2. El motor procesa la cola de datos
-            while not self.data_queue.empty():
-                try:
-                    event = self.data_queue.get(block=False)
-                except Empty:
-                    break
+        data_handler.advance(len(signals) - position)
 
-                if event:
-                    # 3. El motor publica el MarketEvent en el EventBus
-                    logger.debug(f"Procesando MarketEvent para el símbolo {event.symbol} en {event.timestamp}")
-                    self.event_bus.publish(event)
+        logger.info("Backtesting finalizado.")
+
+        self.portfolio.print_final_stats()
+
+    async def run_async(self, max_pending: int = 1) -> None:
+        """
+        Variante asíncrona del bucle principal: un productor obtiene barras con update_bars_async
+        mientras un consumidor las publica en el EventBus, solapando la espera de datos con el
+        procesamiento. Pensada para feeds con I/O (p. ej. en vivo): el productor puede ir hasta
+        max_pending barras por delante, por lo que el consumidor restablece con set_current_bar
+        el último precio del DataHandler a la barra que publica antes de publicarla.
+        """
+        logger.info("Iniciando backtesting (modo asíncrono)...")
+
+        pending: asyncio.Queue[Optional[MarketEvent]] = asyncio.Queue(maxsize=max_pending)
+
+        producer = asyncio.create_task(self._produce_async(pending))
+        await self._consume_async(pending)
+        await producer
 
         logger.info("Backtesting finalizado.")
 
         self.portfolio.print_final_stats()
+
+    async def _produce_async(self, pending: "asyncio.Queue[Optional[MarketEvent]]") -> None:
+        """Avanza el DataHandler y encola los MarketEvent; un None final marca el fin del feed."""
+        try:
+            while self.data_handler.continue_backtest:
+                event = await self.data_handler.update_bars_async()
+
+                if self.data_handler.uses_events_queue:
+                    while self.data_queue:
+                        await pending.put(self.data_queue.popleft())
+                elif event is not None:
+                    await pending.put(event)
+        except BaseException:
+            # Ante un error o una cancelación el consumidor puede haber parado y la cola estar
+            # llena: se descartan las barras pendientes para que el None final no bloquee
+            while not pending.empty():
+                pending.get_nowait()
+            pending.put_nowait(None)
+            raise
+
+        await pending.put(None)
+
+    async def _consume_async(self, pending: "asyncio.Queue[Optional[MarketEvent]]") -> None:
+        """Publica en el EventBus los MarketEvent encolados por el productor hasta el fin del feed."""
+        while True:
+            event = await pending.get()
+            if event is None:
+                break
+
+            # El productor ya puede haber avanzado el DataHandler: las órdenes de esta barra
+            # deben ejecutarse a su precio de cierre y no al de la última barra obtenida
+            self.data_handler.set_current_bar(event)
+
+            logger.debug("Procesando MarketEvent para el símbolo %s en %s", event.symbol, event.timestamp)
+            self.event_bus.publish(event)
+
+    def _drain_data_queue(self) -> None:
+        """Publica en el EventBus todos los MarketEvent pendientes en la cola de datos."""
+        if self.data_queue is None:
+            return
+
+        data_queue = self.data_queue
+        while data_queue:
+            event = data_queue.popleft()
+
+            if event:
+                logger.debug("Procesando MarketEvent para el símbolo %s en %s", event.symbol, event.timestamp)
+                self.event_bus.publish(event)
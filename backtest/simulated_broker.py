@@ -3,7 +3,8 @@ import logging
 from broker import IBroker
 from event_bus import EventBus
 from data import IDataHandler
-from models import CommissionConfig, OrderEvent, Event, OrderType, FillEvent, CommissionType
+from models import CommissionConfig, OrderEvent, OrderType, CommissionType
+from models.pool import acquire_fill_event, release_fill_event
 
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,8 @@ class SimulatedBroker(IBroker):
     Implementación de IBroker que simula la ejecución de órdenes en un entorno de backtesting.
     """
 
+    __slots__ = ('event_bus', 'commission_config', 'data_handler', '_commission_rate', '_commission_is_pct')
+
     def __init__(self, event_bus: EventBus, commission_config: CommissionConfig, data_handler: IDataHandler):
         super().__init__("SimulatedBroker")
 
@@ -21,48 +24,44 @@ class SimulatedBroker(IBroker):
         self.commission_config = commission_config
         self.data_handler = data_handler
 
+        # La fórmula de comisión se resuelve una sola vez: porcentaje del coste o importe fijo
+        self._commission_rate = commission_config.rate
+        self._commission_is_pct = commission_config.type is CommissionType.PERCENTAGE
+        if commission_config.type not in (CommissionType.PERCENTAGE, CommissionType.FIXED):
+            self._commission_rate = 0.0
+
         self.logger.info(
             f"SimulatedBroker inicializado con comisión: {commission_config.rate*100:.2f}% ({commission_config.type.value})"
         )
 
-    def handle(self, event: Event) -> None:
-        """Maneja los eventos entrantes."""
-        if isinstance(event, OrderEvent):
-            self._execute_order(event)
-        else:
-            self.logger.warning(f"SimulatedBroker recibió un evento no soportado: {event}")
+    def handle(self, event: OrderEvent) -> None:
+        """Maneja los eventos entrantes (sólo ORDER, garantizado por el registro)."""
+        self._execute_order(event)
 
     def _execute_order(self, event: OrderEvent) -> None:
         """
         Simula la ejecución de una orden. Asumimos que todas la órdenes MARKET se ejecutan
         inmediatamente al precio de cierre de la vela actual.
         """
-        if event.order_type != OrderType.MARKET:
+        if event.order_type is not OrderType.MARKET:
             self.logger.warning(f"SimulatedBroker solo soporta órdenes MARKET. Orden ignorada: {event}")
             return
         
-        # Obtenemos el precio de ejecución desde el DataHandler
-        try:
-            latest_bars = self.data_handler.get_latest_bars(1)
-            if not latest_bars:
-                self.logger.warning(f"No hay datos de mercado para {event.symbol}. Orden no ejecutada.")
-                return
-            
-            # Asumimos la ejecución al precio de cierre de la vela actual
-            fill_price = self.data_handler.get_latest_price(event.symbol)
-
-            if fill_price is None:
-                self.logger.warning(f"No se pudo obtener el precio de cierre para {event.symbol}. Orden no ejecutada.")
-                return
-            
-        except Exception as e:
-            self.logger.error(f"Error al obtener el precio de ejecución para {event.symbol}: {e}")
+        # Asumimos la ejecución al precio de cierre de la vela actual del DataHandler
+        data_handler = self.data_handler
+        fill_price = data_handler.current_close if data_handler.current_symbol == event.symbol else None
+        if fill_price is None:
+            # DataHandlers que no exponen current_close: se consulta el último precio del símbolo
+            fill_price = data_handler.get_latest_price(event.symbol)
+
+        if fill_price is None:
+            self.logger.warning(f"No se pudo obtener el precio de cierre para {event.symbol}. Orden no ejecutada.")
             return
-        
+
         fill_cost = fill_price * event.quantity
-        commission = self._calculate_commission(fill_cost)
+        commission = fill_cost * self._commission_rate if self._commission_is_pct else self._commission_rate
 
-        fill_event = FillEvent(
+        fill_event = acquire_fill_event(
             timestamp=event.timestamp,
             symbol=event.symbol,
             exchange="SIMULATED",
@@ -73,17 +72,13 @@ class SimulatedBroker(IBroker):
         )
 
         self.logger.info(
-            f"Orden ejecutada: {event.quantity} {event.symbol} a {fill_price:.2f} "
-            f"con comisión {commission:.2f}"
+            "Orden ejecutada: %s %s a %.2f con comisión %.2f",
+            event.quantity, event.symbol, fill_price, commission
         )
 
         # Publicamos el FillEvent en el EventBus
         self.event_bus.publish(fill_event)
 
-    def _calculate_commission(self, fill_cost: float) -> float:
-        """Calcula la comisión basada en la configuración."""
-        if self.commission_config.type == CommissionType.PERCENTAGE:
-            return fill_cost * self.commission_config.rate
-        elif self.commission_config.type == CommissionType.FIXED:
-            return self.commission_config.rate
-        return 0.0
+        # La publicación es síncrona: si el bus permite reciclar, nadie retiene el evento
+        if self.event_bus.recycle_events:
+            release_fill_event(fill_event)
@@ -10,6 +10,8 @@ class IBroker(BaseEventHandler, ABC):
     Interfaz abstracta para todos los brokers, simulados o en vivo.
     """
 
+    __slots__ = ()
+
     @property
     def supported_events(self) -> Set[EventType]:
         """Define el contrato para todos los brokers sobre los tipos de eventos que pueden manejar."""
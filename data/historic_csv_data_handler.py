@@ -1,11 +1,14 @@
 import os
-from queue import Queue
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+import sys
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence
 
-from pandas import DataFrame, Series
+import numpy as np
+from pandas import DataFrame
 import pandas as pd
 from data.i_data_handler import IDataHandler
 from models.events import MarketEvent
+from models.pool import acquire_market_event
 
 
 class HistoricCSVDataHandler(IDataHandler):
@@ -17,72 +20,153 @@ class HistoricCSVDataHandler(IDataHandler):
 
     def __init__(
             self,
-            events_queue: Queue[MarketEvent],
+            events_queue: Optional[Deque[MarketEvent]],
             symbol: str,
             data_frame: DataFrame
     ) -> None:
         self.events_queue = events_queue
-        self.symbol = symbol
+        # Con cola, los MarketEvent se entregan sólo por ella y el motor la vacía tras cada barra
+        self.uses_events_queue = events_queue is not None
+        # Internado para que los filtros por símbolo de las estrategias comparen por identidad
+        self.symbol = sys.intern(symbol)
+
+        # Bloques pendientes cuando los datos se reciben por partes (ver from_loader_iter)
+        self._chunks: Optional[Iterator[DataFrame]] = None
+        self._lookback = 0
+
+        self._set_frame(data_frame)
 
-        self.latest_symbol_data: List[Series] = []
         self._continue_backtest = True
-        self._bar_iterator: Iterator[Tuple[Any, Series]] = data_frame.iterrows()
+
+    @classmethod
+    def from_loader_iter(
+            cls,
+            events_queue: Optional[Deque[MarketEvent]],
+            symbol: str,
+            chunks: Iterable[DataFrame],
+            lookback: int = 1000
+    ) -> "HistoricCSVDataHandler":
+        """
+        Crea un handler que consume los DataFrames de chunks de uno en uno (p. ej. los de
+        BinanceCSVLoader.load_iter), de modo que sólo el bloque actual está en memoria. Al
+        cambiar de bloque se conservan las últimas lookback barras emitidas para get_latest_bars.
+        """
+        chunks = iter(chunks)
+        handler = cls(events_queue, symbol, next(chunks, DataFrame()))
+        handler._chunks = chunks
+        handler._lookback = lookback
+        return handler
+
+    def _set_frame(self, data_frame: DataFrame, carry: int = 0) -> None:
+        """Materializa un bloque de datos, conservando las últimas carry barras ya emitidas."""
+        # Los datos no cambian durante el backtest: se materializan una sola vez
+        # como registros (dict por barra) y timestamps, y se recorren con un cursor.
+        self._data_frame = data_frame
+        bars = data_frame.copy(deep=False)
+        bars['datetime'] = data_frame.index
+        records: List[Dict[str, Any]] = bars.to_dict('records')
+        timestamps: List[Any] = data_frame.index.tolist()
+
+        if carry:
+            records = self._records[self._i - carry:self._i] + records
+            timestamps = self._timestamps[self._i - carry:self._i] + timestamps
+
+        self._records = records
+        self._timestamps = timestamps
+        self._n = len(records)
+        self._i = carry
+
+    def _load_next_chunk(self) -> bool:
+        """Pasa al siguiente bloque no vacío. Devuelve False si no quedan bloques."""
+        if self._chunks is None:
+            return False
+
+        for chunk in self._chunks:
+            if not chunk.empty:
+                self._set_frame(chunk, carry=min(self._lookback, self._i))
+                return True
+
+        return False
 
     @property
     def continue_backtest(self) -> bool:
         """Indica si el backtesting debe continuar."""
         return self._continue_backtest
-        
-    def _get_new_bar(self) -> Optional[Tuple[Any, Series]]:
-        """Devuelve la última barra del feed de datos como una tupla (timestamp, Series)."""
-        try:
-            return next(self._bar_iterator)
-        except StopIteration:
-            self._continue_backtest = False
-            return None
-        except Exception as e:
-            print(f"Error al obtener una nueva barra para el símbolo {self.symbol}: {e}")
+
+    @property
+    def latest_symbol_data(self) -> List[Dict[str, Any]]:
+        """Barras ya emitidas, en orden cronológico (con datos por bloques, sólo las que siguen en memoria)."""
+        return self._records[:self._i]
+
+    def _get_new_bar(self) -> Optional[Dict[str, Any]]:
+        """Devuelve la siguiente barra del feed de datos como un diccionario."""
+        if self._i >= self._n and not self._load_next_chunk():
             self._continue_backtest = False
             return None
-        
-    def update_bars(self) -> None:
-        """Obtiene la siguiente barra de datos y, si tiene éxito, la almacena y coloca un MarketEvent en la cola de eventos."""
+
+        record = self._records[self._i]
+        self._i += 1
+        return record
+
+    def update_bars(self) -> Optional[MarketEvent]:
+        """
+        Obtiene la siguiente barra de datos y devuelve su MarketEvent. Si se proporcionó
+        una cola de eventos, el evento también se coloca en ella.
+        """
         if not self.continue_backtest:
-            return
-        
-        bar_tuple = self._get_new_bar()
+            return None
+
+        bar = self._get_new_bar()
+
+        if bar is None:
+            return None
 
-        if bar_tuple is not None:
-            index, bar_data = bar_tuple
+        self.current_symbol = self.symbol
+        self.current_close = bar.get('close')
 
-            bar_data_with_dt = bar_data.copy()
-            bar_data_with_dt['datetime'] = index
+        event = acquire_market_event(self.symbol, self._timestamps[self._i - 1], bar)
 
-            self.latest_symbol_data.append(bar_data_with_dt)
+        if self.events_queue is not None:
+            self.events_queue.append(event)
 
-            self.events_queue.put(MarketEvent(
-                symbol=self.symbol,
-                timestamp=index,
-                data=bar_data_with_dt.to_dict()
-            ))
+        return event
 
-    def get_latest_bars(self, N: int = 1) -> List[Series]:
+    def get_latest_bars(self, N: int = 1) -> List[Dict[str, Any]]:
         """Devuelve las últimas N barras."""
-        try:
-            return self.latest_symbol_data[-N:]
-        except Exception as e:
-            # No hay suficientes barras disponibles, devolver todas las disponibles
-            return self.latest_symbol_data
-        
+        return self._records[max(self._i - N, 0):self._i]
+
     def get_latest_price(self, symbol: str) -> Optional[float]:
-        """Retorna el último precio de cierre (close) de la barra más reciente almacentada en latest_symbol_data."""
+        """Retorna el último precio de cierre (close) de la barra más reciente emitida."""
         # Este handler solo maneja un símbolo, así que ignoramos si pide otro símbolo
-        if symbol != self.symbol or not self.latest_symbol_data:
+        if symbol != self.symbol or self._i == 0:
             return None
-        
+
         try:
-            latest_bar = self.latest_symbol_data[-1]
+            latest_bar = self._records[self._i - 1]
             return float(latest_bar['close'])
         except Exception as e:
             raise ValueError(f"No se pudo obtener el último precio para el símbolo {symbol}: {e}")
 
+    def get_ohlcv_array(self, columns: Sequence[str]) -> Optional[np.ndarray]:
+        """Devuelve las barras pendientes como matriz de float64, extraída por columnas del DataFrame."""
+        # Con datos por bloques no se dispone de todas las barras de una vez
+        if self._chunks is not None:
+            return None
+
+        if not all(col in self._data_frame.columns for col in columns):
+            return None
+
+        return self._data_frame[list(columns)].to_numpy(dtype=np.float64)[self._i:]
+
+    def advance(self, n: int) -> Optional[datetime]:
+        """Avanza el cursor n barras sin emitir MarketEvent y devuelve el timestamp de la última."""
+        self._i = min(self._i + n, self._n)
+        if self._i >= self._n:
+            self._continue_backtest = False
+
+        if self._i == 0:
+            return None
+
+        self.current_symbol = self.symbol
+        self.current_close = self._records[self._i - 1].get('close')
+        return self._timestamps[self._i - 1]
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from queue import Queue
-from typing import Optional
+from datetime import datetime
+from typing import Deque, Optional, Sequence
+
+import numpy as np
 
 from models.events import MarketEvent
 
@@ -10,7 +12,18 @@ class IDataHandler(ABC):
     Clase abstracta para manejadores de datos de mercado, tanto históricos como en vivo.
     """
 
-    events_queue: Queue[MarketEvent]
+    events_queue: Optional[Deque[MarketEvent]]
+
+    # Los handlers con un productor propio (p. ej. feeds en vivo en otro hilo) entregan
+    # los MarketEvent a través de events_queue; el resto los devuelve desde update_bars.
+    # append/popleft de deque son atómicos, pero un productor que necesite bloqueo o
+    # límites de capacidad debe envolver la cola con su propio mecanismo thread-safe.
+    uses_events_queue: bool = False
+
+    # Símbolo y precio de cierre de la última barra emitida, para lecturas directas en el camino caliente.
+    # Son opcionales: si un handler no los actualiza, el broker recurre a get_latest_price.
+    current_symbol: Optional[str] = None
+    current_close: Optional[float] = None
 
     @property
     @abstractmethod
@@ -29,7 +42,27 @@ class IDataHandler(ABC):
         raise NotImplementedError("Este método debe ser implementado por la subclase.")
     
     @abstractmethod
-    def update_bars(self):
-        """Avanza el feed de datos en un paso y coloca un MarketEvent en la cola de eventos."""
+    def update_bars(self) -> Optional[MarketEvent]:
+        """Avanza el feed de datos en un paso y devuelve el MarketEvent generado, si lo hay."""
         raise NotImplementedError("Este método debe ser implementado por la subclase.")
-    
\ No newline at end of file
+
+    async def update_bars_async(self) -> Optional[MarketEvent]:
+        """Versión asíncrona de update_bars. Los handlers con I/O real deben sobrescribirla."""
+        return self.update_bars()
+
+    def set_current_bar(self, event: MarketEvent) -> None:
+        """Fija current_symbol y current_close a la barra de event, la que se va a publicar."""
+        self.current_symbol = event.symbol
+        data = event.data
+        self.current_close = data.get('close') if data else None
+
+    def get_ohlcv_array(self, columns: Sequence[str]) -> Optional[np.ndarray]:
+        """
+        Devuelve las barras pendientes como matriz (n_barras, len(columns)) de float64 para el
+        modo vectorizado, o None si el handler no lo soporta.
+        """
+        return None
+
+    def advance(self, n: int) -> Optional[datetime]:
+        """Avanza el feed n barras sin emitir MarketEvent y devuelve el timestamp de la última."""
+        raise NotImplementedError("Este handler no soporta el modo vectorizado.")
@@ -1,11 +1,15 @@
+import logging
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 
 from data.loaders.i_data_loader import IDataLoader
 
 
+logger = logging.getLogger(__name__)
+
+
 class BinanceCSVLoader(IDataLoader):
     """
     Implementación de IDataLoader que carga archivos CSV con el formato
@@ -13,6 +17,10 @@ class BinanceCSVLoader(IDataLoader):
     """
 
     DATETIME_UNIT = "ms"
+
+    # Marcadores de valor ausente que aparecen en algunos volcados, además de los de pandas.
+    # Se leen como NaN (y la fila se descarta) en lugar de hacer fallar la conversión de tipos.
+    NA_VALUES = ["-", "--", "?"]
     
     def __init__(self, binance_columns: List[str] = [
         "openTime",
@@ -24,25 +32,90 @@ class BinanceCSVLoader(IDataLoader):
         "closeTime",
         "quoteAssetVolume",
         "numberOfTrades"
-    ]) -> None:
-        super().__init__(binance_columns)
+    ], columns: Optional[List[str]] = None, cache_dir: Optional[Path] = None, float_dtype: str = "float64") -> None:
+        super().__init__(binance_columns, columns, cache_dir, float_dtype)
 
     def load(self, path: Path) -> pd.DataFrame:
         """Carga un archivo CSV de Binance, lo normaliza y lo devuelve."""
         try:
-            df = pd.read_csv(path, header=0)
+            df = self._read_csv(path)
+        except ValueError as e:
+            logger.warning("Valores no numéricos en %s (%s); se lee con conversión tolerante.", path, e)
+            df = self._coerce_numeric(self._read_csv(path, typed=False))
+
+        return self._normalize(df)
+
+    def load_iter(self, path: Path, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Carga un archivo CSV de Binance por bloques de hasta chunksize filas, normalizando cada
+        uno al leerlo, para no mantener el fichero completo en memoria.
+        """
+        rows_read = 0
+        with self._read_csv(path, chunksize=chunksize) as reader:
+            while True:
+                try:
+                    chunk = next(reader, None)
+                except ValueError as e:
+                    logger.warning("Valores no numéricos en %s (%s); se lee con conversión tolerante.", path, e)
+                    break
+
+                if chunk is None:
+                    return
+
+                rows_read += len(chunk)
+                yield self._normalize(chunk)
+
+        # El resto del fichero, desde el bloque que falló, se lee sin tipos y se convierte por columna
+        with self._read_csv(path, typed=False, chunksize=chunksize, skiprows=range(1, rows_read + 1)) as reader:
+            for chunk in reader:
+                yield self._normalize(self._coerce_numeric(chunk))
+
+    def _read_csv(self, path: Path, typed: bool = True, **kwargs: Any) -> Any:
+        """
+        Lee el CSV con las columnas del mapeo. Con typed, el parser de C convierte en línea a los
+        tipos declarados y una celda no numérica lanza ValueError; sin typed se lee como texto.
+        """
+        if typed:
+            # El tiempo se lee como float64 (exacto para ms) para que las celdas vacías sean NaN
+            dtype_map = {col: self.float_dtype for col in self.exchange_columns[1:]}
+            dtype_map[self.exchange_columns[0]] = "float64"
+        else:
+            dtype_map = object
+
+        try:
+            return pd.read_csv(
+                path,
+                header=0,
+                usecols=lambda col: col in self.mapping_columns,
+                dtype=dtype_map,
+                na_values=self.NA_VALUES,
+                **kwargs,
+            )
         except FileNotFoundError as e:
-            print(f"Error: Archivo no encontrado en la ruta {path}: {e}")
+            logger.error("Archivo no encontrado en la ruta %s: %s", path, e)
+            raise
+        except ValueError:
+            # Celdas no convertibles al tipo declarado: el llamador reintenta sin tipos
             raise
         except Exception as e:
-            print(f"Error al leer el archivo CSV {path}: {e}")
+            logger.error("Error al leer el archivo CSV %s: %s", path, e)
             raise
 
+    def _coerce_numeric(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convierte las columnas leídas como texto a numéricas; los valores no válidos quedan como NaN."""
+        exchange_time_col = self.exchange_columns[0]
+        for col in df.columns:
+            values = pd.to_numeric(df[col], errors='coerce')
+            df[col] = values.astype("float64" if col == exchange_time_col else self.float_dtype)
+        return df
+
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Renombra las columnas, indexa por tiempo y descarta filas incompletas."""
         # Renombrar las columnas según el mapeo definido
         try:
             df.rename(columns=self.mapping_columns, inplace=True)
         except Exception as e:
-            print(f"Error al renombrar las columnas del DataFrame: {e}")
+            logger.error("Error al renombrar las columnas del DataFrame: %s", e)
             raise
 
         # Convertir la columna de tiempo y establecerla como índice
@@ -50,17 +123,14 @@ class BinanceCSVLoader(IDataLoader):
         if datetime_col not in df.columns:
             raise ValueError(f"La columna de tiempo original '{datetime_col}' no está en el DataFrame.")
 
-        df[datetime_col] = pd.to_datetime(df[datetime_col], unit=self.DATETIME_UNIT)
-        df.set_index(datetime_col, inplace=True)
-
-        # Convertir las demás columnas a tipos numéricos
         for col in self.columns[1:]:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-            else:
+            if col not in df.columns:
                 raise ValueError(f"La columna esperada '{col}' no está en el DataFrame.")
-            
-        # Eliminar filas con datos faltantes
+
+        # Eliminar filas con datos faltantes, incluidas las de tiempo vacío o no válido
         df.dropna(inplace=True)
 
+        df.index = pd.to_datetime(df.pop(datetime_col).to_numpy(dtype="int64"), unit=self.DATETIME_UNIT)
+        df.index.name = datetime_col
+
         return df
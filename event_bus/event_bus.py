@@ -2,22 +2,39 @@ from collections import deque
 import logging
 from typing import List
 
-from event_bus import EventHandlerRegistry, HandlerNotFoundError
+from event_bus import EventHandlerRegistry, IEventHandler
 from models import Event
 
 
 logger = logging.getLogger(__name__)
 
 
+def _noop(event: Event) -> None:
+    """Sustituto de la inserción en el historial cuando éste está deshabilitado."""
+
+
 class EventBus:
     """
     Event Bus síncrono que maneja la publicación y distribución de eventos.
     """
 
-    def __init__(self, registry: EventHandlerRegistry, max_history: int = 0):
+    __slots__ = (
+        'registry', '_get_single_handler', '_get_handlers', 'max_history', '_history', '_history_append',
+        'recycle_events', '_events_published', '_handlers_executed', '_handler_errors',
+    )
+
+    def __init__(self, registry: EventHandlerRegistry, max_history: int = 0, recycle_events: bool = False):
         self.registry = registry
+        # Métodos de consulta del registro resueltos una sola vez para el camino caliente de publish
+        self._get_single_handler = registry.get_single_handler
+        self._get_handlers = registry.get_handlers
         self.max_history = max_history
         self._history: deque = deque(maxlen=max_history if max_history > 0 else None)
+        # Se resuelve una sola vez si publish debe guardar los eventos en el historial
+        self._history_append = self._history.append if max_history > 0 else _noop
+        # Reciclar eventos de los pools es opcional: sólo es seguro si ningún handler conserva
+        # el evento tras handle() y el bus no guarda historial
+        self.recycle_events = recycle_events and max_history <= 0
         self._events_published = 0
         self._handlers_executed = 0
         self._handler_errors = 0
@@ -26,42 +43,72 @@ class EventBus:
 
     def publish(self, event: Event) -> None:
         """Publica un evento y lo distribuye a los manejadores registrados."""
-        if not event:
+        if event is None:
             logger.warning("Intento de publicar un evento nulo.")
             return
         
         self._events_published += 1
 
-        # Añadir al historial si está habilitado
-        if self.max_history > 0:
-            self._history.append(event)
+        # Añadir al historial (no-op si está deshabilitado)
+        self._history_append(event)
+
+        # El tipo de evento se lee una sola vez y se usa como clave de despacho
+        event_type = event.type
+
+        # Se evalúa una sola vez por evento para no formatear mensajes de debug descartados
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Publicando evento: %s (#%d)", event_type, self._events_published)
 
-        logger.debug(f"Publicando evento: {event.type} (#{self._events_published})")
+        # Camino rápido: un único handler registrado para este tipo de evento
+        single_handler = self._get_single_handler(event_type)
+        if single_handler is not None:
+            try:
+                single_handler.handle(event)
+                self._handlers_executed += 1
+                if debug:
+                    logger.debug("Manejador '%s' ejecutado para evento '%s'.", single_handler.handler_name, event_type)
+
+            except Exception as e:
+                self._on_handler_error(single_handler, event, e)
+
+            return
 
         try:
             # Obtener handlers para este tipo de evento
-            handlers = self.registry.get_handlers(event.type)
+            handlers = self._get_handlers(event_type)
 
-            logger.debug(f"Distribuyendo evento '{event.type}' a {len(handlers)} manejadores.")
+            if not handlers:
+                # No hay handlers registrados para este tipo de evento - no es un error
+                if debug:
+                    logger.debug("No hay manejadores registrados para el evento '%s'.", event_type)
+                return
 
-            # Ejecutar cada handler
+            if debug:
+                logger.debug("Distribuyendo evento '%s' a %d manejadores.", event_type, len(handlers))
+
+            # Ejecutar cada handler; el contador se actualiza una sola vez por evento
+            executed = 0
             for handler in handlers:
                 try:
                     handler.handle(event)
-                    self._handlers_executed += 1
-                    logger.debug(f"Manejador '{handler.handler_name}' ejecutado para evento '{event.type}'.")
+                    executed += 1
+                    if debug:
+                        logger.debug("Manejador '%s' ejecutado para evento '%s'.", handler.handler_name, event_type)
 
                 except Exception as e:
-                    self._handler_errors += 1
-                    logger.error(f"Error en manejador '{handler.handler_name}' para evento '{event.type}': {str(e)}", exc_info=True)
+                    self._on_handler_error(handler, event, e)
                     # Continuar con el siguiente handler
 
-        except HandlerNotFoundError:
-            # No hay handlers registrados para este tipo de evento - no es un error
-            logger.debug(f"No hay manejadores registrados para el evento '{event.type}'.")
+            self._handlers_executed += executed
 
         except Exception as e:
-            logger.error(f"Error al publicar evento '{event.type}': {str(e)}", exc_info=True)
+            logger.error("Error al publicar evento '%s': %s", event_type, e, exc_info=True)
+
+    def _on_handler_error(self, handler: IEventHandler, event: Event, error: Exception) -> None:
+        """Registra el error de un manejador sin interrumpir la distribución del evento."""
+        self._handler_errors += 1
+        logger.error("Error en manejador '%s' para evento '%s': %s", handler.handler_name, event.type, error, exc_info=True)
 
     def get_history(self) -> List[Event]:
         """Retorna el historial de eventos publicados."""
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from collections import defaultdict
 import logging
-from typing import Callable, Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from models import Event, EventType
 from event_bus import HandlerRegistrationError, HandlerNotFoundError
@@ -13,10 +13,16 @@ logger = logging.getLogger(__name__)
 class IEventHandler(ABC):
     """Interfaz para los manejadores de eventos del Event Bus."""
 
+    __slots__ = ()
+
     @abstractmethod
     def handle(self, event: Event) -> None:
         """
-        Maneja un evento específico.
+        Maneja un evento específico. El registro sólo entrega eventos cuyo tipo está en
+        supported_events, así que las implementaciones pueden asumir ese tipo sin re-verificarlo.
+        El evento y su data no deben modificarse (data puede ser el registro interno del
+        DataHandler) y, si el EventBus recicla eventos (recycle_events), tampoco conservarse
+        tras handle(): hay que copiar los campos necesarios.
         """
         raise NotImplementedError("El método handle debe ser implementado por la subclase.")
     
@@ -44,9 +50,28 @@ class EventHandlerRegistry:
     def __init__(self):
         self._handlers: Dict[EventType, List[IEventHandler]] = defaultdict(list)
         self._handler_events: Dict[IEventHandler, Set[EventType]] = {}
+        # Tuplas inmutables por tipo de evento, reconstruidas sólo al registrar/desregistrar
+        self._handlers_tuple_cache: Dict[EventType, Tuple[IEventHandler, ...]] = {}
+        # Tipos de evento con un único manejador, para el despacho directo sin bucle
+        self._single_handlers: Dict[EventType, IEventHandler] = {}
 
         logger.info("Registro de manejadores de eventos inicializado.")
 
+    def _refresh_cache(self, event_type: EventType) -> None:
+        """
+        Reconstruye la tupla cacheada de manejadores para un tipo de evento.
+        """
+        handlers = self._handlers.get(event_type)
+        if handlers:
+            self._handlers_tuple_cache[event_type] = tuple(handlers)
+        else:
+            self._handlers_tuple_cache.pop(event_type, None)
+
+        if handlers and len(handlers) == 1:
+            self._single_handlers[event_type] = handlers[0]
+        else:
+            self._single_handlers.pop(event_type, None)
+
     def register_handler(self, handler: IEventHandler) -> None:
         """
         Registra un manejador para sus tipos de eventos soportados.
@@ -72,6 +97,7 @@ class EventHandlerRegistry:
             for event_type in supported_events:
                 if handler not in self._handlers[event_type]:
                     self._handlers[event_type].append(handler)
+                    self._refresh_cache(event_type)
                     logger.debug(f"Manejador '{handler.handler_name}' registrado para el evento '{event_type.name}'.")
 
             # Mantener mapeo inverso
@@ -101,6 +127,7 @@ class EventHandlerRegistry:
         for event_type in supported_events:
             if handler in self._handlers[event_type]:
                 self._handlers[event_type].remove(handler)
+                self._refresh_cache(event_type)
                 logger.debug(f"Manejador '{handler.handler_name}' desregistrado del evento '{event_type.name}'.")
 
         # Remover del mapeo inverso
@@ -108,34 +135,47 @@ class EventHandlerRegistry:
 
         logger.info(f"Manejador '{handler.handler_name}' desregistrado exitosamente.")
 
-    def get_handlers(self, event_type: EventType) -> List[IEventHandler]:
+    def get_handlers(self, event_type: EventType) -> Tuple[IEventHandler, ...]:
+        """
+        Retorna la tupla de manejadores registrados para un tipo de evento específico.
+        Si no hay ninguno, retorna una tupla vacía.
+        """
+        return self._handlers_tuple_cache.get(event_type, ())
+
+    def get_single_handler(self, event_type: EventType) -> Optional[IEventHandler]:
+        """
+        Retorna el manejador si es el único registrado para el tipo de evento, o None en otro caso.
+        """
+        return self._single_handlers.get(event_type)
+
+    def get_handlers_strict(self, event_type: EventType) -> Tuple[IEventHandler, ...]:
         """
-        Retorna la lista de manejadores registrados para un tipo de evento específico.
+        Igual que get_handlers, pero lanza HandlerNotFoundError si no hay manejadores registrados.
         """
-        handlers = self._handlers.get(event_type, [])
+        handlers = self.get_handlers(event_type)
 
         if not handlers:
             raise HandlerNotFoundError(event_type.value)
-        
-        return handlers.copy()
+
+        return handlers
     
     def has_handlers(self, event_type: EventType) -> bool:
         """
         Verifica si hay manejadores registrados para un tipo de evento específico.
         """
-        return len(self._handlers.get(event_type, [])) > 0
+        return event_type in self._handlers_tuple_cache
     
     def get_all_registered_events(self) -> Set[EventType]:
         """
         Retorna un conjunto de todos los tipos de eventos que tienen manejadores registrados.
         """
-        return {event_type for event_type, handlers in self._handlers.items() if handlers}
+        return set(self._handlers_tuple_cache)
     
     def get_handler_count(self, event_type: EventType) -> int:
         """
         Retorna el número de manejadores registrados para un tipo de evento específico.
         """
-        return len(self._handlers.get(event_type, []))
+        return len(self._handlers_tuple_cache.get(event_type, ()))
     
     def clear(self) -> None:
         """
@@ -143,6 +183,8 @@ class EventHandlerRegistry:
         """
         self._handlers.clear()
         self._handler_events.clear()
+        self._handlers_tuple_cache.clear()
+        self._single_handlers.clear()
         logger.info("Todos los manejadores de eventos han sido limpiados del registro.")
 
     def __str__(self) -> str:
@@ -162,9 +204,12 @@ class BaseEventHandler(IEventHandler):
     Implementación base de un manejador de eventos.
     """
 
-    def __init__(self, name: Optional[str] = None):
+    # Las subclases que declaren sus propios __slots__ no tendrán __dict__
+    __slots__ = ('_name', 'logger')
+
+    def __init__(self, name: Optional[str] = None, logger_name: Optional[str] = None):
         self._name = name or self.__class__.__name__
-        self.logger = logging.getLogger(f"{__name__}.{self._name}")
+        self.logger = logging.getLogger(logger_name or f"{__name__}.{self._name}")
 
     @property
     def handler_name(self) -> str:
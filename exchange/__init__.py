@@ -5,14 +5,10 @@ Este módulo proporciona las abstracciones y implementaciones
 para conectarse a exchanges de criptomonedas, tanto para 
 obtener datos de mercado en vivo como para ejecutar órdenes.
 """
-from .i_exchange_connector import (
-    IExchangeConnector,
-    MarketDataCallback,
-    OrderUpdateCallback
-)
+from .i_exchange_connector import IExchangeConnector
+from .ring_buffer import TickerRing
 
 __all__ = [
     "IExchangeConnector",
-    "MarketDataCallback",
-    "OrderUpdateCallback",
+    "TickerRing",
 ]
\ No newline at end of file
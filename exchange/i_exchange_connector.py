@@ -1,14 +1,12 @@
 from abc import ABC, abstractmethod
 import logging
-from typing import Any, Callable, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 from models import OrderEvent
 from models.config import ExchangeSettings
 from models.exchange_state import Balance, Order, Ticker
-
-
-MarketDataCallback = Callable[[Ticker], None]
-OrderUpdateCallback = Callable[[Order], None]
+from models.pool import acquire_ticker, release_ticker
+from exchange.ring_buffer import TickerRing
 
 
 class IExchangeConnector(ABC):
@@ -20,6 +18,9 @@ class IExchangeConnector(ABC):
         self.config = config
         self._is_api_connected = False
         self._is_ws_connected = False
+
+        # Buffer acotado entre el lector del WebSocket y los consumidores de datos de mercado
+        self.market_ring = TickerRing(config.market_ring_capacity)
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.logger.info(f"Iniciando conector de exchange {self.__class__.__name__}")
 
@@ -29,12 +30,12 @@ class IExchangeConnector(ABC):
         pass
 
     @abstractmethod
-    def connect_ws(self) -> None:
+    async def connect_ws(self) -> None:
         """Establece y autentica la conexión con el WebSocket del exchange."""
         pass
 
     @abstractmethod
-    def disconnect_ws(self) -> None:
+    async def disconnect_ws(self) -> None:
         """Cierra la conexión con el WebSocket del exchange."""
         pass
 
@@ -66,17 +67,31 @@ class IExchangeConnector(ABC):
         pass
 
     # --- Métodos WebSocket ---
+    # Las suscripciones se implementan como generadores asíncronos (async def ... yield): el
+    # lector del WebSocket no queda bloqueado por el consumidor y éste puede procesar por lotes.
 
     @abstractmethod
-    def subscribe_to_market_data(self, symbols: List[str], callback: MarketDataCallback) -> None:
-        """Suscribe a un stream de datos de mercado para un símbolo."""
+    def subscribe_to_market_data(self, symbols: List[str]) -> AsyncIterator[Ticker]:
+        """Suscribe a un stream de datos de mercado para los símbolos y devuelve sus tickers."""
         pass
 
     @abstractmethod
-    def subscribe_to_order_updates(self, callback: OrderUpdateCallback) -> None:
-        """Suscribe a un stream de actualizaciones de órdenes."""
+    def subscribe_to_order_updates(self) -> AsyncIterator[Order]:
+        """Suscribe a un stream de actualizaciones de órdenes y devuelve cada actualización."""
         pass
 
+    # --- Pool de tickers ---
+    # Las implementaciones deben construir los tickers del stream con acquire_ticker en lugar
+    # de instanciar Ticker, y los consumidores liberarlos cuando ya no conserven la referencia.
+
+    def acquire_ticker(self, symbol: str, timestamp: int, last: float, bid: float, ask: float, volume: float) -> Ticker:
+        """Obtiene un Ticker del pool con los valores indicados."""
+        return acquire_ticker(symbol, timestamp, last, bid, ask, volume)
+
+    def release_ticker(self, ticker: Ticker) -> None:
+        """Devuelve al pool un Ticker ya procesado."""
+        release_ticker(ticker)
+
     # --- Propiedades de estado ---
 
     @property
@@ -0,0 +1,74 @@
+from typing import List, Optional, Tuple
+
+from models.exchange_state import Ticker
+
+
+class TickerRing:
+    """
+    Buffer circular de capacidad fija para los tickers recibidos por WebSocket, con un único
+    productor (el lector del socket) y un único consumidor, que pueden estar en hilos distintos.
+    Cuando está lleno el productor sobrescribe el ticker más antiguo sin bloquearse; sólo el
+    consumidor avanza la posición de lectura y es él quien detecta los tickers perdidos.
+    """
+
+    __slots__ = ('_slots', '_mask', '_head', '_tail', '_skipped')
+
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError(f"La capacidad del buffer debe ser una potencia de 2: {capacity}")
+
+        # Cada posición guarda (secuencia, ticker) para detectar si se sobrescribió antes de leerla
+        self._slots: List[Optional[Tuple[int, Ticker]]] = [None] * capacity
+        self._mask = capacity - 1
+
+        # Secuencias monótonas: head (siguiente escritura) sólo la escribe el productor y
+        # tail (siguiente lectura) y skipped sólo el consumidor
+        self._head = 0
+        self._tail = 0
+        self._skipped = 0
+
+    @property
+    def capacity(self) -> int:
+        """Número máximo de tickers que puede retener el buffer."""
+        return self._mask + 1
+
+    @property
+    def dropped(self) -> int:
+        """Número de tickers sobrescritos por el productor antes de que el consumidor los leyera."""
+        return self._skipped + max(self._head - self._tail - self._mask - 1, 0)
+
+    def __len__(self) -> int:
+        return min(self._head - self._tail, self._mask + 1)
+
+    def push(self, ticker: Ticker) -> None:
+        """Escribe un ticker, sobrescribiendo el más antiguo si el buffer está lleno."""
+        head = self._head
+        # Una única asignación: el consumidor nunca ve una posición a medio escribir
+        self._slots[head & self._mask] = (head, ticker)
+        self._head = head + 1
+
+    def pop(self) -> Optional[Ticker]:
+        """Extrae el ticker más antiguo aún disponible, o None si el buffer está vacío."""
+        tail = self._tail
+        while tail != self._head:
+            sequence, ticker = self._slots[tail & self._mask]
+            if sequence == tail:
+                self._tail = tail + 1
+                return ticker
+
+            # El productor dio la vuelta y sobrescribió la posición: se salta a la más antigua vigente
+            oldest = max(self._head - self._mask - 1, tail + 1)
+            self._skipped += oldest - tail
+            tail = oldest
+
+        self._tail = tail
+        return None
+
+    def drain(self) -> List[Ticker]:
+        """Extrae todos los tickers pendientes en orden de llegada."""
+        tickers = []
+        ticker = self.pop()
+        while ticker is not None:
+            tickers.append(ticker)
+            ticker = self.pop()
+        return tickers
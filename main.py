@@ -1,84 +1,198 @@
+import asyncio
+import atexit
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+import os
+from queue import SimpleQueue
 import sys
 from pathlib import Path
-from queue import Queue
+from typing import TYPE_CHECKING, Callable, List, Optional
 
-import pandas as pd
-
-from backtest.engine import BacktestEngine
-from backtest.simulated_broker import SimulatedBroker
-from data import BinanceCSVLoader
-from data.historic_csv_data_handler import HistoricCSVDataHandler
-from event_bus import EventBus, EventHandlerRegistry
 from models import TradingConfig, load_config
-from models.config import DataSourceType
-from order_manager.simple_order_manager import SimpleOrderManager
-from portfolio import SimplePortfolio
-from sizing import FixedQuantitySizer
-from strategies.simple_price_strategy import SimplePriceStrategy
+from models.config import CSVDataSourceSettings, DataSourceType
+
+# pandas, numpy y los componentes del backtest se importan al usarse: cargarlos cuesta
+# unos 250 ms que no deben pagar los arranques que fallan al leer la configuración
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+# Registros acumulados antes de escribir en el fichero de log
+LOG_FILE_BUFFER_CAPACITY = 1024
+
+# Listener que escribe en los handlers reales desde un hilo propio (ver setup_logging)
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Vacía la cola de logs pendiente y cierra los handlers del listener activo."""
+    global _log_listener
+
+    if _log_listener is None:
+        return
+
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+        # MemoryHandler vuelca su buffer al cerrarse pero no cierra el handler destino
+        if isinstance(handler, MemoryHandler) and handler.target is not None:
+            handler.target.close()
+    _log_listener = None
+
+
+# Un único hook de salida para todas las llamadas a setup_logging: cada una detiene el listener
+# anterior antes de crear el suyo, así que basta con detener el activo al terminar
+atexit.register(_stop_log_listener)
 
 
 def setup_logging(config: TradingConfig) -> logging.Logger:
     """Configura el sistema de logging según la configuración cargada."""
+    global _log_listener
+
+    log_cfg = config.logging
+    console_cfg = log_cfg.console
+    file_cfg = log_cfg.file
+
+    # Niveles resueltos una sola vez a partir de sus nombres
+    level_names = logging.getLevelNamesMapping()
+    root_level, console_level, file_level = (
+        level_names.get(level, logging.INFO)
+        for level in (log_cfg.level, console_cfg.level, file_cfg.level)
+    )
+
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, config.logging.level, logging.INFO))
+    root_logger.setLevel(root_level)
+
+    _stop_log_listener()
 
     while root_logger.handlers:
         handler = root_logger.handlers.pop()
         handler.close()
 
-    formatter = logging.Formatter(config.logging.format)
+    formatter = logging.Formatter(log_cfg.format)
+    handlers: List[logging.Handler] = []
 
-    if config.logging.console.enabled:
+    if console_cfg.enabled:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, config.logging.console.level, logging.INFO))
+        console_handler.setLevel(console_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
-    if config.logging.file.enabled:
-        log_path = Path(config.logging.file.path)
+    if file_cfg.enabled:
+        log_path = Path(file_cfg.path)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_path, encoding="utf-8")
-        file_handler.setLevel(getattr(logging, config.logging.file.level, logging.INFO))
+        file_handler = RotatingFileHandler(
+            log_path,
+            maxBytes=file_cfg.max_size_mb * 1024 * 1024,
+            backupCount=file_cfg.backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
 
-    return logging.getLogger(__name__)
-
-
-def load_historical_data(config: TradingConfig, logger: logging.Logger) -> pd.DataFrame:
+        # Las escrituras al fichero se agrupan en lotes; los errores se vuelcan de inmediato
+        buffered_file_handler = MemoryHandler(
+            capacity=LOG_FILE_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        buffered_file_handler.setLevel(file_level)
+        handlers.append(buffered_file_handler)
+
+    # El hilo que registra sólo encola el LogRecord; la escritura en consola y fichero
+    # la hace el QueueListener en segundo plano.
+    if handlers:
+        log_queue: SimpleQueue = SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+
+    return logger
+
+
+def get_event_loop_factory(logger: logging.Logger) -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Devuelve la fábrica de bucles de uvloop si está instalado (dependencia opcional), para
+    pasarla a asyncio.run(loop_factory=...) sin instalar una política global (obsoleta en 3.14).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop no está instalado; se usa el bucle de asyncio por defecto.")
+        return None
+
+    logger.info("Se usará el bucle de eventos uvloop.")
+    return uvloop.new_event_loop
+
+
+def find_csv_files(data_path: Path, csv_settings: CSVDataSourceSettings) -> List[Path]:
+    """Lista los ficheros de data_path cuyo nombre coincide con el patrón configurado."""
+    file_pattern = csv_settings.file_pattern
+
+    # Los patrones con subdirectorios o recursivos ("**") siguen resolviéndose con glob
+    if "/" in file_pattern or os.sep in file_pattern or "**" in file_pattern:
+        return list(data_path.glob(file_pattern))
+
+    if not data_path.is_dir():
+        return []
+
+    # Un único scandir con la expresión regular cacheada, sin compilar el patrón en cada llamada.
+    # Los ficheros ocultos (".foo.csv") sólo se incluyen si el propio patrón empieza por punto.
+    pattern_re = csv_settings.file_pattern_regex
+    include_hidden = file_pattern.startswith(".")
+    with os.scandir(data_path) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if (include_hidden or not entry.name.startswith(".")) and pattern_re.match(entry.name) and entry.is_file()
+        ]
+
+
+def load_historical_data(config: TradingConfig, logger: logging.Logger) -> "pd.DataFrame":
     """Carga datos históricos para backtesting."""
-    data_frames = []
+    import numpy as np
+
+    from data import BinanceCSVLoader
+    from strategies.base_strategy import OHLCV_COLUMNS
 
     if config.data_source.type == DataSourceType.CSV:
-        data_path = Path(config.data_source.csv.data_path)
-        file_pattern = config.data_source.csv.file_pattern
-        logger.info(f"Cargando datos CSV desde {data_path.absolute()} con patrón {file_pattern}")
+        csv_cfg = config.data_source.csv
+        data_path = Path(csv_cfg.data_path)
+        logger.info("Cargando datos CSV desde %s con patrón %s", data_path.absolute(), csv_cfg.file_pattern)
 
-        csv_files = list(data_path.glob(file_pattern))
+        csv_files = find_csv_files(data_path, csv_cfg)
         if not csv_files:
             raise FileNotFoundError("No se encontraron archivos CSV. Verifica la ruta y el patrón especificados.")
         
-        logger.info(f"Se encontraron {len(csv_files)} archivos CSV para cargar.")
+        logger.info("Se encontraron %d archivos CSV para cargar.", len(csv_files))
         
-        loader = BinanceCSVLoader()
-
-        for file in sorted(csv_files):
-            try:
-                df = loader.load(file)
-                data_frames.append(df)
-                logger.debug(f"Archivo {file.name} cargado con {df.shape[0]} filas.")
-            except Exception as e:
-                raise ValueError(f"Error al cargar el archivo {file.name}: {e}")
-            
-        if not data_frames:
-            raise ValueError("No se pudieron cargar datos de los archivos CSV proporcionados.")
-        
-        all_data = pd.concat(data_frames)
-        all_data.sort_index(inplace=True)
-        all_data = all_data[~all_data.index.duplicated(keep='first')]
-
-        logger.info(f"Datos concatenados y ordenados. Total de filas {len(all_data)}. Período desde {all_data.index.min()} hasta {all_data.index.max()}.")
+        # Sólo se parsean las columnas OHLCV que consumen las estrategias
+        loader = BinanceCSVLoader(
+            columns=list(OHLCV_COLUMNS),
+            cache_dir=csv_cfg.cache_dir,
+            float_dtype=csv_cfg.float_dtype,
+        )
+
+        all_data = loader.load_many(sorted(csv_files))
+        # Los ficheros de Binance ya vienen ordenados por tiempo: sólo se reordena si hace falta,
+        # con un orden estable para que entre duplicados prevalezca el del primer fichero
+        if not all_data.index.is_monotonic_increasing:
+            all_data.sort_index(inplace=True, kind='mergesort')
+
+        # Con el índice ordenado los duplicados son consecutivos: basta comparar cada barra con la anterior
+        timestamps = all_data.index.asi8
+        keep = np.empty(len(timestamps), dtype=bool)
+        keep[:1] = True
+        np.not_equal(timestamps[1:], timestamps[:-1], out=keep[1:])
+        if not keep.all():
+            all_data = all_data[keep]
+
+        logger.info(
+            "Datos concatenados y ordenados. Total de filas %d. Período desde %s hasta %s.",
+            len(all_data), all_data.index.min(), all_data.index.max()
+        )
 
         return all_data
     
@@ -93,20 +207,31 @@ def main():
     config = load_config()
     logger = setup_logging(config)
 
-    logger.info("Configuración de la aplicación: %s", config.app)
-    logger.info("Configuración de la fuente de datos: %s", config.data_source)
-    logger.info("Configuración de la estrategia: %s", config.strategy)
-    logger.info("Configuración de backtesting: %s", config.backtesting)
-    logger.info("Configuración de la base de datos: %s", config.database)
-    logger.info("Configuración del sistema de eventos: %s", config.events)
-    logger.info("Configuración del sistema de logging: %s", config.logging)
-    logger.info("Configuración de los símbolos: %s", config.symbols)
+    # El repr de los modelos de configuración anidados no es trivial: sólo se registra si INFO está activo
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Configuración de la aplicación: %s", config.app)
+        logger.info("Configuración de la fuente de datos: %s", config.data_source)
+        logger.info("Configuración de la estrategia: %s", config.strategy)
+        logger.info("Configuración de backtesting: %s", config.backtesting)
+        logger.info("Configuración de la base de datos: %s", config.database)
+        logger.info("Configuración del sistema de eventos: %s", config.events)
+        logger.info("Configuración del sistema de logging: %s", config.logging)
+        logger.info("Configuración de los símbolos: %s", config.symbols)
 
     logger.info("Aplicación iniciada")
 
     if config.app.debug:
         logger.debug("Modo de depuración activado")
 
+    from backtest.engine import BacktestEngine
+    from backtest.simulated_broker import SimulatedBroker
+    from data.historic_csv_data_handler import HistoricCSVDataHandler
+    from event_bus import EventBus, EventHandlerRegistry
+    from order_manager.simple_order_manager import SimpleOrderManager
+    from portfolio import SimplePortfolio
+    from sizing import FixedQuantitySizer
+    from strategies.simple_price_strategy import SimplePriceStrategy
+
     # Inicializar el registro y el bus de eventos
 
     registry = EventHandlerRegistry()
@@ -124,7 +249,7 @@ def main():
     historical_data = load_historical_data(config, logger)
     symbol = config.symbols[0].symbol
     data_handler = HistoricCSVDataHandler(
-        events_queue=Queue(),
+        events_queue=None,
         symbol=symbol,
         data_frame=historical_data
     )
@@ -148,7 +273,7 @@ def main():
         initial_capital=config.backtesting.initial_capital
     )
     registry.register_handler(portfolio)
-    logger.info(f"SimplePortfolio registrada en el Event Bus con capital inicial {config.backtesting.initial_capital}")
+    logger.info("SimplePortfolio registrada en el Event Bus con capital inicial %s", config.backtesting.initial_capital)
 
     sizer = FixedQuantitySizer(
         default_quantity=config.strategy.sizing.value
@@ -165,7 +290,7 @@ def main():
         sizer=sizer
     )
     registry.register_handler(order_manager)
-    logger.info(f"SimpleOrderManager registrada en el Event Bus.")
+    logger.info("SimpleOrderManager registrada en el Event Bus.")
 
     broker = SimulatedBroker(
         event_bus=event_bus,
@@ -184,9 +309,10 @@ def main():
         portfolio=portfolio,
         order_manager=order_manager,
         broker=broker,
-        event_bus=event_bus
+        event_bus=event_bus,
+        loop_factory=get_event_loop_factory(logger) if config.backtesting.async_mode else None,
     )
-    
+
     engine.run()
 
 if __name__ == "__main__":
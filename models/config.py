@@ -3,8 +3,11 @@ Módulo para definir la configuración del sistema de trading.
 """
 
 from enum import Enum
+from fnmatch import translate
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict, YamlConfigSettingsSource
@@ -79,6 +82,21 @@ class CSVDataSourceSettings(BaseModel):
     data_path: str = "backtest_data"
     file_pattern: str = "*.csv"
     timestamp_column: str = "openTime"
+    # Directorio donde cachear los CSV ya parseados entre ejecuciones; None lo desactiva
+    cache_dir: Optional[str] = None
+    # Tipo de las columnas numéricas; float32 ahorra memoria pero limita la precisión a ~7 dígitos
+    float_dtype: Literal["float64", "float32"] = "float64"
+
+    @property
+    def file_pattern_regex(self) -> re.Pattern:
+        """Expresión regular equivalente a file_pattern, compilada una sola vez por patrón."""
+        return _compile_file_pattern(self.file_pattern)
+
+
+@lru_cache(maxsize=32)
+def _compile_file_pattern(pattern: str) -> re.Pattern:
+    """Compila un patrón glob de nombre de fichero a expresión regular."""
+    return re.compile(translate(pattern))
 
 
 class ExchangeSettings(BaseModel):
@@ -88,6 +106,15 @@ class ExchangeSettings(BaseModel):
     api_key: str = ""
     api_secret: str = ""
     base_url: str = "https://api.binance.com"
+    market_ring_capacity: int = 1024
+
+    @field_validator('market_ring_capacity')
+    @classmethod
+    def validate_ring_capacity(cls, v: int) -> int:
+        """TickerRing requiere una capacidad potencia de 2; se valida al cargar la configuración."""
+        if v <= 0 or v & (v - 1):
+            raise ValueError(f"market_ring_capacity debe ser una potencia de 2 positiva: {v}")
+        return v
 
 
 class BinanceAPISettings(BaseModel):
@@ -173,6 +200,7 @@ class BacktestingConfig(BaseModel):
     save_trades: bool = True
     save_portfolio_snapshots: bool = True
     generate_report: bool = True
+    async_mode: bool = Field(default=False, description="Solapa la obtención de barras y su procesamiento con asyncio. Pensado para feeds con I/O; los CSV históricos usan el bucle síncrono.")
 
 
 class SQLiteSettings(BaseModel):
@@ -1,19 +1,21 @@
-from enum import Enum
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel
-
 from models.enums import EventType, SignalType, OrderType, OrderDirection
 
 
-class Event(BaseModel):
+# Los eventos se crean en cada barra y los producen componentes internos que ya trabajan con
+# valores normalizados: se definen como dataclasses con __slots__, sin la validación de Pydantic.
+@dataclass(slots=True, kw_only=True)
+class Event:
     """
     Clase base para todos los eventos en el sistema de trading.
     """
     type: EventType
 
 
+@dataclass(slots=True, kw_only=True)
 class MarketEvent(Event):
     """
     Indica una nueva actualización de datos de mercado.
@@ -22,8 +24,9 @@ class MarketEvent(Event):
     symbol: str
     timestamp: datetime
     data: Optional[Dict[str, Any]] = None
-    
 
+
+@dataclass(slots=True, kw_only=True)
 class SignalEvent(Event):
     """
     Maneja el envío de una señal desde un objeto Strategy.
@@ -34,6 +37,7 @@ class SignalEvent(Event):
     signal_type: SignalType
 
 
+@dataclass(slots=True, kw_only=True)
 class OrderEvent(Event):
     """
     Maneja el envío de una orden a un sistema de ejecución.
@@ -47,6 +51,7 @@ class OrderEvent(Event):
     price: Optional[float] = None
 
 
+@dataclass(slots=True, kw_only=True)
 class FillEvent(Event):
     """
     Encapsula la noción de una orden que ha sido ejecutada.
@@ -61,6 +66,7 @@ class FillEvent(Event):
     commission: float
 
 
+@dataclass(slots=True, kw_only=True)
 class PortfolioEvent(Event):
     """
     Evento para actualizaciones de portafolio.
@@ -72,6 +78,7 @@ class PortfolioEvent(Event):
     positions: Dict[str, float]
 
 
+@dataclass(slots=True, kw_only=True)
 class BacktestEvent(Event):
     """
     Evento específico para backtesting.
@@ -82,6 +89,7 @@ class BacktestEvent(Event):
     message: Optional[str] = None
 
 
+@dataclass(slots=True, kw_only=True)
 class ErrorEvent(Event):
     """
     Evento para reportar errores en el sistema.
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import Optional
 from pydantic import BaseModel, ConfigDict
 
@@ -7,9 +8,12 @@ from models.enums import OrderDirection, OrderStatus, OrderType
 model_config = ConfigDict(frozen=True)
 
 
-class Ticker(BaseModel):
+# Los tickers llegan por WebSocket a alta frecuencia y se crean ya normalizados (ver
+# models.pool.acquire_ticker): se definen sin validación de Pydantic y sin congelar,
+# para que el pool pueda reutilizarlos.
+@dataclass(slots=True, kw_only=True)
+class Ticker:
     """Representa el estado del ticker de un símbolo."""
-    model_config = model_config
 
     symbol: str
     timestamp: int # timestamp in milliseconds
@@ -0,0 +1,100 @@
+"""
+Pools de eventos reutilizables para los caminos calientes del backtest.
+
+Los eventos se reutilizan asignando directamente sus campos, sin ninguna validación, por lo
+que sólo deben adquirirse con valores ya normalizados.
+Un evento sólo puede liberarse cuando ningún componente conserva una referencia a él
+(p. ej. el historial del EventBus o una cola de eventos).
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from models.enums import OrderDirection
+from models.events import FillEvent, MarketEvent
+from models.exchange_state import Ticker
+
+
+MAX_POOL_SIZE = 64
+
+_market_pool: List[MarketEvent] = []
+_fill_pool: List[FillEvent] = []
+_ticker_pool: List[Ticker] = []
+
+
+def acquire_market_event(symbol: str, timestamp: datetime, data: Optional[Dict[str, Any]]) -> MarketEvent:
+    """Devuelve un MarketEvent reutilizado del pool o uno nuevo si el pool está vacío."""
+    if not _market_pool:
+        return MarketEvent(symbol=symbol, timestamp=timestamp, data=data)
+
+    event = _market_pool.pop()
+    event.symbol = symbol
+    event.timestamp = timestamp
+    event.data = data
+    return event
+
+
+def release_market_event(event: MarketEvent) -> None:
+    """Devuelve un MarketEvent al pool para su reutilización."""
+    event.data = None
+    if len(_market_pool) < MAX_POOL_SIZE:
+        _market_pool.append(event)
+
+
+def acquire_fill_event(
+        timestamp: datetime,
+        symbol: str,
+        exchange: str,
+        quantity: float,
+        direction: OrderDirection,
+        fill_cost: float,
+        commission: float
+) -> FillEvent:
+    """Devuelve un FillEvent reutilizado del pool o uno nuevo si el pool está vacío."""
+    if not _fill_pool:
+        return FillEvent(
+            timestamp=timestamp,
+            symbol=symbol,
+            exchange=exchange,
+            quantity=quantity,
+            direction=direction,
+            fill_cost=fill_cost,
+            commission=commission
+        )
+
+    event = _fill_pool.pop()
+    event.timestamp = timestamp
+    event.symbol = symbol
+    event.exchange = exchange
+    event.quantity = quantity
+    event.direction = direction
+    event.fill_cost = fill_cost
+    event.commission = commission
+    return event
+
+
+def release_fill_event(event: FillEvent) -> None:
+    """Devuelve un FillEvent al pool para su reutilización."""
+    if len(_fill_pool) < MAX_POOL_SIZE:
+        _fill_pool.append(event)
+
+
+def acquire_ticker(symbol: str, timestamp: int, last: float, bid: float, ask: float, volume: float) -> Ticker:
+    """Devuelve un Ticker reutilizado del pool o uno nuevo si el pool está vacío."""
+    if not _ticker_pool:
+        return Ticker(symbol=symbol, timestamp=timestamp, last=last, bid=bid, ask=ask, volume=volume)
+
+    ticker = _ticker_pool.pop()
+    ticker.symbol = symbol
+    ticker.timestamp = timestamp
+    ticker.last = last
+    ticker.bid = bid
+    ticker.ask = ask
+    ticker.volume = volume
+    return ticker
+
+
+def release_ticker(ticker: Ticker) -> None:
+    """Devuelve un Ticker al pool para su reutilización."""
+    if len(_ticker_pool) < MAX_POOL_SIZE:
+        _ticker_pool.append(ticker)
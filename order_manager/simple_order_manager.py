@@ -2,7 +2,7 @@ import logging
 from typing import Optional
 
 from event_bus import EventBus
-from models import Event, SignalEvent, OrderEvent, OrderType, SignalType, OrderDirection
+from models import SignalEvent, OrderEvent, OrderType, SignalType, OrderDirection
 from portfolio import IPortfolio
 from data import IDataHandler
 from sizing import IOrderSizer
@@ -11,6 +11,23 @@ from order_manager import IOrderManager
 
 logger = logging.getLogger(__name__)
 
+# Dirección de la orden según (tipo de señal, signo de la posición actual: 1, 0 o -1)
+_DIRECTIONS = {
+    (SignalType.LONG, 0): OrderDirection.BUY,
+    (SignalType.SHORT, 0): OrderDirection.SELL,
+    (SignalType.EXIT, 1): OrderDirection.SELL,
+    (SignalType.EXIT, -1): OrderDirection.BUY,
+}
+
+# Motivo registrado cuando una señal no genera orden (no se manejan reversiones)
+_NO_ORDER_REASONS = {
+    (SignalType.LONG, 1): (logging.DEBUG, "OrderManager: Ya en posición LONG para %s. No se crea orden."),
+    (SignalType.LONG, -1): (logging.WARNING, "OrderManager: Señal LONG para %s pero ya en posición SHORT. No se maneja reversión."),
+    (SignalType.SHORT, -1): (logging.DEBUG, "OrderManager: Ya en posición SHORT para %s. No se crea orden."),
+    (SignalType.SHORT, 1): (logging.WARNING, "OrderManager: Señal SHORT para %s pero ya en posición LONG. No se maneja reversión."),
+    (SignalType.EXIT, 0): (logging.DEBUG, "OrderManager: Señal EXIT para %s pero ya en posición FLAT. No se crea orden."),
+}
+
 
 class SimpleOrderManager(IOrderManager):
     """
@@ -24,75 +41,50 @@ class SimpleOrderManager(IOrderManager):
         self.data_handler = data_handler
         self.sizer = sizer
 
-        logger.info(f"SimpleOrderManager inicializado con sizer: {type(self.sizer).__name__}")
+        logger.info("SimpleOrderManager inicializado con sizer: %s", type(sizer).__name__)
 
-    def handle(self, event: Event) -> None:
-        """Maneja los eventos de señal."""
-        if not isinstance(event, SignalEvent):
-            self.logger.warning(f"Evento no soportado recibido en SimpleOrderManager: {event}")
-            return
-        
-        logger.debug(f"OrderManager: Procesando SignalEvent para {event.symbol} de tipo {event.signal_type}")
+    def handle(self, event: SignalEvent) -> None:
+        """Maneja los eventos de señal (sólo SIGNAL, garantizado por el registro)."""
+        symbol = event.symbol
+        signal_type = event.signal_type
+        logger.debug("OrderManager: Procesando SignalEvent para %s de tipo %s", symbol, signal_type)
 
         # Determinar la dirección
-        direction = self._calculate_direction(event.signal_type, event.symbol)
+        direction = self._calculate_direction(signal_type, symbol)
         if direction is None:
-            logger.debug(f"OrderManager: Señal {event.signal_type} para {event.symbol} no requiere orden. Ignorando.")
+            logger.debug("OrderManager: Señal %s para %s no requiere orden. Ignorando.", signal_type, symbol)
             return
         
         # Calcular la cantidad usando el sizer
         quantity = self.sizer.calculate_quantity(event, self.portfolio, self.data_handler)
         if quantity <= 1e-8:
-            logger.debug(f"OrderManager: Cantidad calculada es cero para {event.symbol}. No se crea orden.")
+            logger.debug("OrderManager: Cantidad calculada es cero para %s. No se crea orden.", symbol)
             return
         
         # Crear y publicar la orden
+        timestamp = event.timestamp
         order = OrderEvent(
-            symbol=event.symbol,
-            timestamp=event.timestamp,
+            symbol=symbol,
+            timestamp=timestamp,
             order_type=OrderType.MARKET,
             direction=direction,
             quantity=quantity,
         )
 
         logger.info(
-            f"OrderManager publicando OrderEvent: {order.direction} {order.quantity} de {order.symbol} "
-            f"a las {order.timestamp}"
+            "OrderManager publicando OrderEvent: %s %s de %s a las %s",
+            direction, quantity, symbol, timestamp
         )
         self.event_bus.publish(order)
 
     def _calculate_direction(self, signal_type: SignalType, symbol: str) -> Optional[OrderDirection]:
         """Calcula la dirección de la orden basada en el tipo de señal y la posición actual."""
         current_position = self.portfolio.get_position_size(symbol)
-        pos_is_long = current_position > 1e-8
-        pos_is_short = current_position < -1e-8
-        pos_is_flat = not pos_is_long and not pos_is_short
+        key = (signal_type, (current_position > 1e-8) - (current_position < -1e-8))
 
-        if signal_type == SignalType.LONG:
-            if pos_is_long:
-                logger.debug(f"OrderManager: Ya en posición LONG para {symbol}. No se crea orden.")
-                return None
-            if pos_is_short:
-                logger.warning(f"OrderManager: Señal LONG para {symbol} pero ya en posición SHORT. No se maneja reversión.")
-                return None
-            return OrderDirection.BUY
-        
-        elif signal_type == SignalType.SHORT:
-            if pos_is_short:
-                logger.debug(f"OrderManager: Ya en posición SHORT para {symbol}. No se crea orden.")
-                return None
-            if pos_is_long:
-                logger.warning(f"OrderManager: Señal SHORT para {symbol} pero ya en posición LONG. No se maneja reversión.")
-                return None
-            return OrderDirection.SELL
-        
-        elif signal_type == SignalType.EXIT:
-            if pos_is_long:
-                return OrderDirection.SELL
-            if pos_is_short:
-                return OrderDirection.BUY
-            
-            logger.debug(f"OrderManager: Señal EXIT para {symbol} pero ya en posición FLAT. No se crea orden.")
-            return None
-        
-        return None
+        direction = _DIRECTIONS.get(key)
+        if direction is None:
+            reason = _NO_ORDER_REASONS.get(key)
+            if reason is not None:
+                logger.log(reason[0], reason[1], symbol)
+        return direction
@@ -1,16 +1,20 @@
-from collections import defaultdict
 import logging
-from typing import Dict, Set
+from typing import Dict
 
-from models.events import Event
 from portfolio import IPortfolio
 from event_bus import EventBus
 from data import IDataHandler
-from models import EventType, FillEvent, OrderDirection
+from models import FillEvent, OrderDirection
 
 
 logger = logging.getLogger(__name__)
 
+# Signo de la operación según la dirección: una compra suma la cantidad y resta el coste
+_DIRECTION_SIGNS = {
+    OrderDirection.BUY: 1.0,
+    OrderDirection.SELL: -1.0,
+}
+
 
 class SimplePortfolio(IPortfolio):
     """
@@ -24,21 +28,17 @@ class SimplePortfolio(IPortfolio):
         self.initial_capital = initial_capital
         self.current_cash = initial_capital
 
-        self.positions: Dict[str, float] = defaultdict(float)
+        self.positions: Dict[str, float] = {}
+
+        # Agregados de las ejecuciones para el resumen final; el detalle por fill sólo se registra en DEBUG
+        self.fill_count = 0
+        self.total_commission = 0.0
 
         logger.info(f"SimplePortfolio inicializado con capital inicial: {self.initial_capital}")
 
-    @property
-    def supported_events(self) -> Set[EventType]:
-        """Define los tipos de eventos que la cartera puede manejar."""
-        return {EventType.FILL}
-    
-    def handle(self, event: Event) -> None:
-        """Maneja los eventos de tipo FILL para actualizar la cartera."""
-        if isinstance(event, FillEvent):
-            self._update_on_fill(event)
-        else:
-            self.logger.warning(f"Evento no soportado recibido en SimplePortfolio: {event}")
+    def handle(self, event: FillEvent) -> None:
+        """Maneja los eventos de tipo FILL (garantizado por el registro) para actualizar la cartera."""
+        self._update_on_fill(event)
 
     def _update_on_fill(self, event: FillEvent) -> None:
         """Actualiza la cartera en función de un FillEvent."""
@@ -48,26 +48,22 @@ class SimplePortfolio(IPortfolio):
         fill_cost = event.fill_cost
         commission = event.commission
 
-        # Actualizar la cantidad de la posición
-        if direction == OrderDirection.BUY:
-            self.positions[symbol] += quantity
-        elif direction == OrderDirection.SELL:
-            self.positions[symbol] -= quantity
-
-        # Redondear para evitar problemas de precisión flotante
-        self.positions[symbol] = round(self.positions[symbol], 8)
-
-        # Actualizar el efectivo disponible
-        if direction == OrderDirection.BUY:
-            # En una compra, el costo y la comisión se restan del efectivo
-            self.current_cash -= (fill_cost + commission)
-        elif direction == OrderDirection.SELL:
-            # En una venta, el costo se suma y la comisión se resta del efectivo
-            self.current_cash += (fill_cost - commission)
+        # Una compra suma la cantidad y resta el coste; una venta resta la cantidad y suma el coste.
+        # La comisión siempre se resta del efectivo.
+        sign = _DIRECTION_SIGNS.get(direction)
+        if sign is None:
+            logger.warning("Dirección de fill desconocida para %s: %r. Fill ignorado.", symbol, direction)
+            return
+
+        positions = self.positions
+        positions[symbol] = positions.get(symbol, 0.0) + sign * quantity
+        self.current_cash -= sign * fill_cost + commission
+        self.fill_count += 1
+        self.total_commission += commission
         
-        logger.info(
-            f"Actualización de carter ({event.direction.value}): "
-            f"Símbolo: {symbol}, Cantidad: {quantity}, Costo: {fill_cost}, Comisión: {commission}. "
+        logger.debug(
+            "Actualización de cartera (%s): Símbolo: %s, Cantidad: %s, Costo: %s, Comisión: %s. ",
+            direction, symbol, quantity, fill_cost, commission
         )
 
     def get_position_size(self, symbol: str) -> float:
@@ -113,6 +109,7 @@ class SimplePortfolio(IPortfolio):
         pnl_pct = (pnl_total / self.initial_capital) * 100.0
 
         self.logger.info("-" * 60)
+        self.logger.info(f"Ejecuciones: {self.fill_count}, Comisiones Totales: {self.total_commission:.2f} USD")
         self.logger.info(f"Efectivo Final: {self.current_cash:.2f} USD")
         self.logger.info(f"Valor de Mercado de Posiciones: {holdings_market_value:.2f} USD")
         self.logger.info(f"Valor Total del Portafolio: {total_portfolio_value:.2f} USD")
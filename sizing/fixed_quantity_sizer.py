@@ -24,29 +24,29 @@ class FixedQuantitySizer(IOrderSizer):
         """Calcula la cantidad fija para la orden."""
         symbol = signal.symbol
 
-        if signal.signal_type == SignalType.EXIT:
+        if signal.signal_type is SignalType.EXIT:
             # Para un EXIT, la cantidad es la posición actual absoluta.
             current_position = portfolio.get_position_size(symbol)
             quantity = abs(current_position)
 
             if quantity > 1e-8: # Evitar órdenes de polvo
                 logger.debug(
-                    f"Sizer: Señal EXIT para {symbol}. "
-                    f"Posición actual: {current_position}, cantidad a cerrar: {quantity}"
+                    "Sizer: Señal EXIT para %s. Posición actual: %s, cantidad a cerrar: %s",
+                    symbol, current_position, quantity
                 )
                 return quantity
             else:
-                logger.debug(f"Sizer: Señal EXIT para {symbol} pero no hay posición ({current_position}). Cantidad: 0.0")
+                logger.debug("Sizer: Señal EXIT para %s pero no hay posición (%s). Cantidad: 0.0", symbol, current_position)
                 return 0.0
             
-        elif signal.signal_type == SignalType.LONG or signal.signal_type == SignalType.SHORT:
+        elif signal.signal_type is SignalType.LONG or signal.signal_type is SignalType.SHORT:
             logger.debug(
-                f"Sizer: Señal {signal.signal_type} para {symbol}. "
-                f"Cantidad fija asignada: {self.default_quantity}"
+                "Sizer: Señal %s para %s. Cantidad fija asignada: %s",
+                signal.signal_type, symbol, self.default_quantity
             )
             return self.default_quantity
         
         else:
-            logger.warning(f"Sizer: Tipo de señal desconocido {signal.signal_type} para {symbol}. Cantidad: 0.0")
+            logger.warning("Sizer: Tipo de señal desconocido %s para %s. Cantidad: 0.0", signal.signal_type, symbol)
             return 0.0
         
\ No newline at end of file
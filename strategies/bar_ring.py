@@ -0,0 +1,60 @@
+from numbers import Real
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class BarRing:
+    """
+    Buffer circular de capacidad fija con las últimas barras de un símbolo. Los valores numéricos
+    se guardan en una matriz preasignada de float64, de modo que añadir una barra no copia el
+    histórico; el DataFrame sólo se construye al leerlo con to_frame.
+    """
+
+    __slots__ = ('columns', '_values', '_timestamps', '_head', '_count')
+
+    def __init__(self, columns: Sequence[str], capacity: int = 1000) -> None:
+        if capacity <= 0:
+            raise ValueError(f"La capacidad del buffer debe ser positiva: {capacity}")
+
+        self.columns = list(columns)
+        self._values = np.full((capacity, len(self.columns)), np.nan)
+        self._timestamps: List[Any] = [None] * capacity
+
+        # head es la siguiente fila de escritura y count el número de barras retenidas
+        self._head = 0
+        self._count = 0
+
+    @classmethod
+    def for_bar(cls, data: Dict[str, Any], capacity: int = 1000) -> "BarRing":
+        """Crea un buffer con las columnas numéricas de una barra de ejemplo."""
+        columns = [col for col, value in data.items() if isinstance(value, (Real, np.number))]
+        return cls(columns, capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Número máximo de barras que puede retener el buffer."""
+        return len(self._timestamps)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: Any, data: Dict[str, Any]) -> None:
+        """Escribe una barra, sobrescribiendo la más antigua si el buffer está lleno."""
+        head = self._head
+        # Las columnas ausentes en la barra quedan como NaN
+        self._values[head] = [data.get(col, np.nan) for col in self.columns]
+        self._timestamps[head] = timestamp
+
+        capacity = len(self._timestamps)
+        self._head = head + 1 if head + 1 < capacity else 0
+        if self._count < capacity:
+            self._count += 1
+
+    def to_frame(self, periods: Optional[int] = None) -> pd.DataFrame:
+        """Devuelve las últimas periods barras (todas si es None) en orden cronológico."""
+        n = self._count if periods is None else min(periods, self._count)
+        rows = (np.arange(self._head - n, self._head)) % len(self._timestamps)
+        index = pd.Index([self._timestamps[row] for row in rows], name='timestamp')
+        return pd.DataFrame(self._values[rows], index=index, columns=self.columns)
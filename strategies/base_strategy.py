@@ -1,11 +1,25 @@
 from abc import ABC, abstractmethod
-import logging
-from typing import Any, Dict, List, Optional, Set
+from datetime import datetime
+import sys
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pandas as pd
 
 from event_bus import BaseEventHandler, EventBus
-from models import SignalEvent, EventType, Event, MarketEvent, SignalType
+from models import SignalEvent, EventType, MarketEvent, SignalType
+from strategies.bar_ring import BarRing
+
+
+# Columnas de la matriz que recibe compute_signals, en este orden
+OHLCV_COLUMNS: Tuple[str, ...] = ('open', 'high', 'low', 'close', 'volume')
+
+# Códigos de señal devueltos por compute_signals; 0 indica que no hay señal en la barra
+SIGNAL_CODES: Dict[int, SignalType] = {
+    1: SignalType.LONG,
+    -1: SignalType.SHORT,
+    2: SignalType.EXIT,
+}
 
 
 class BaseStrategy(BaseEventHandler, ABC):
@@ -15,20 +29,21 @@ class BaseStrategy(BaseEventHandler, ABC):
 
     def __init__(self, name: str, symbols: List[str], event_bus: EventBus, parameters: Optional[Dict[str, Any]] = None) -> None:
         """Inicializa la estrategia con un nombre, símbolos y parámetros opcionales."""
-        super().__init__(name)
+        super().__init__(name, logger_name=f"{__name__}.{name}")
         self.name = name
-        self.symbols = set(symbols)
+        # Símbolos internados: el filtro por símbolo de cada evento se resuelve por identidad
+        self.symbols = frozenset(sys.intern(symbol) for symbol in symbols)
         self.parameters = parameters or {}
         self.event_bus = event_bus
 
-        # Estado interno
-        self._market_data: Dict[str, pd.DataFrame] = {}
+        # Estado interno: últimas max_history barras por símbolo
+        self._max_history = self.parameters.get('max_history', 1000)
+        # Por defecto sólo se publican los cambios de señal; una señal igual a la anterior se descarta
+        self._emit_duplicates = self.parameters.get('emit_duplicates', False)
+        self._market_data: Dict[str, BarRing] = {}
         self._last_signals: Dict[str, SignalEvent] = {}
         self._is_active = True
 
-        # Configuración de logging
-        self.logger = logging.getLogger(f"{__name__}.{self.name}")
-
         self.logger.info(f"Estrategia '{self.name}' inicializada con símbolos: {self.symbols}")
 
     @property
@@ -36,22 +51,12 @@ class BaseStrategy(BaseEventHandler, ABC):
         """Eventos que maneja esta estrategia."""
         return {EventType.MARKET}
     
-    def handle(self, event: Event) -> None:
-        """Handler principal de eventos. Distribuye según el tipo de evento."""
-        if not self._is_active:
+    def handle(self, event: MarketEvent) -> None:
+        """Handler principal de eventos (sólo MARKET, garantizado por el registro)."""
+        # Filtrar por estado y por símbolos de interés en la misma llamada, sin un nivel intermedio
+        if not self._is_active or event.symbol not in self.symbols:
             return
-        
-        if isinstance(event, MarketEvent):
-            self._handle_market_event(event)
-        else:
-            self.logger.warning(f"Estrategia '{self.name}' recibió evento no soportado: {event.type}")
-    
-    def _handle_market_event(self, event: MarketEvent) -> None:
-        """Procesa un evento de mercado."""
-        # Filtrar por símbolos de interés
-        if event.symbol not in self.symbols:
-            return
-        
+
         try:
             # Actualizar datos internos
             self._update_market_data(event)
@@ -64,68 +69,65 @@ class BaseStrategy(BaseEventHandler, ABC):
                 self._emit_signal(signal, event)
 
         except Exception as e:
-            self.logger.error(f"Error procesando MarketEvent para símbolo {event.symbol}: {e}")
+            self.logger.error("Error procesando MarketEvent para símbolo %s: %s", event.symbol, e)
 
     def _update_market_data(self, event: MarketEvent) -> None:
         """Actualiza el cache interno de datos de mercado."""
-        symbol = event.symbol
-
-        # Inicializar DataFrame si no existe
-        if symbol not in self._market_data:
-            self._market_data[symbol] = pd.DataFrame()
-
-        # Convertir datos del evento a fila de DataFrame
-        if event.data:
-            row_data = {
-                'timestamp': event.timestamp,
-                **event.data
-            }
-
-            # Crear nueva fila y concatenar
-            new_row = pd.DataFrame([row_data])
-            new_row.set_index('timestamp', inplace=True)
+        data = event.data
+        if not data:
+            return
 
-            self._market_data[symbol] = pd.concat([
-                self._market_data[symbol],
-                new_row
-            ])
+        # Las columnas del buffer se fijan con la primera barra del símbolo
+        ring = self._market_data.get(event.symbol)
+        if ring is None:
+            ring = self._market_data[event.symbol] = BarRing.for_bar(data, self._max_history)
 
-            # Mantener sólo los últimos N registros para eficiencia
-            max_history = self.parameters.get('max_history', 1000)
-            if len(self._market_data[symbol]) > max_history:
-                self._market_data[symbol] = self._market_data[symbol].tail(max_history)
+        ring.append(event.timestamp, data)
 
     def _emit_signal(self, signal_type: SignalType, market_event: MarketEvent) -> None:
         """Emite una señal de trading."""
+        self.emit_signal(market_event.symbol, market_event.timestamp, signal_type)
+
+    def emit_signal(self, symbol: str, timestamp: datetime, signal_type: SignalType) -> None:
+        """Publica una señal de trading para un símbolo y momento dados."""
+        if not self._emit_duplicates:
+            last_signal = self._last_signals.get(symbol)
+            if last_signal is not None and last_signal.signal_type is signal_type:
+                return
+
         signal = SignalEvent(
-            symbol=market_event.symbol,
-            timestamp=market_event.timestamp,
+            symbol=symbol,
+            timestamp=timestamp,
             signal_type=signal_type
         )
 
         # Guardar referencia a la última señal
-        self._last_signals[market_event.symbol] = signal
+        self._last_signals[symbol] = signal
 
         # Emitir al Event Bus
         self.event_bus.publish(signal)
-        self.logger.info(f"Estrategia '{self.name}' con símbolo {market_event.symbol} emitió señal: {signal}")
+        self.logger.info("Estrategia '%s' con símbolo %s emitió señal: %s", self.name, symbol, signal)
 
     @abstractmethod
     def calculate_signal(self, market_event: MarketEvent) -> Optional[SignalType]:
         """Lógica principal de la estrategia. Debe ser implementada por subclases."""
         pass
 
+    def compute_signals(self, ohlcv: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Versión vectorizada de calculate_signal para BacktestEngine.run_vectorized. Recibe una
+        matriz (n_barras, 5) con las columnas de OHLCV_COLUMNS y devuelve un array de n_barras
+        códigos de SIGNAL_CODES. Devuelve None si la estrategia no la soporta.
+        """
+        return None
+
     def get_market_data(self, symbol: str, periods: Optional[int] = None) -> pd.DataFrame:
-        """Obtiene los datos de mercado almacenados para un símbolo dado."""
-        if symbol not in self._market_data:
+        """Obtiene las columnas numéricas de los datos de mercado almacenados para un símbolo dado."""
+        ring = self._market_data.get(symbol)
+        if ring is None:
             return pd.DataFrame()
-        
-        data = self._market_data[symbol]
 
-        if periods is not None and len(data) > periods:
-            return data.tail(periods)
-        
-        return data.copy()
+        return ring.to_frame(periods)
     
     def get_last_signal(self, symbol: str) -> Optional[SignalEvent]:
         """Obtiene la última señal generada para un símbolo dado."""
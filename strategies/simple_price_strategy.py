@@ -1,6 +1,8 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from models import SignalType
 from models.events import MarketEvent
 from strategies import BaseStrategy
@@ -22,27 +24,35 @@ class SimplePriceStrategy(BaseStrategy):
     def calculate_signal(self, market_event: MarketEvent) -> SignalType | None:
         """Calcula la señal basada en la relación open/close."""
 
-        if not market_event or not market_event.data:
-            self.logger.warning(f"Estrategia '{self.name}': Datos de mercado no disponibles para el símbolo {market_event.symbol}")
+        data = market_event.data if market_event else None
+        if not data:
+            self.logger.warning("Estrategia '%s': Datos de mercado no disponibles para el símbolo %s", self.name, market_event.symbol)
             return None
         
         # Extraer precios de apertura y cierre del diccionario 'data'
-        open_price = market_event.data.get("open")
-        close_price = market_event.data.get("close")
+        open_price = data.get("open")
+        close_price = data.get("close")
 
         # Verificar que tenemos ambos precios
         if open_price is None or close_price is None:
-            self.logger.warning(f"Estrategia '{self.name}': Precios de apertura o cierre no disponibles para el símbolo {market_event.symbol}")
+            self.logger.warning("Estrategia '%s': Precios de apertura o cierre no disponibles para el símbolo %s", self.name, market_event.symbol)
             return None
         
-        self.logger.debug(f"Estrategia '{self.name}': Símbolo {market_event.symbol} - Open: {open_price}, Close: {close_price}")
+        self.logger.debug("Estrategia '%s': Símbolo %s - Open: %s, Close: %s", self.name, market_event.symbol, open_price, close_price)
 
         # Lógica simple de señal
         if close_price > open_price:
-            self.logger.info(f"Generando señal LONG para {market_event.symbol} (Close > Open)")
+            self.logger.debug("Generando señal LONG para %s (Close > Open)", market_event.symbol)
             return SignalType.LONG
         elif close_price < open_price:
-            self.logger.info(f"Generando señal EXIT para {market_event.symbol} (Close < Open)")
+            self.logger.debug("Generando señal EXIT para %s (Close < Open)", market_event.symbol)
             return SignalType.EXIT
         else:
             return None
+
+    def compute_signals(self, ohlcv: np.ndarray) -> np.ndarray:
+        """Calcula en bloque las señales de todas las barras: LONG si C > O, EXIT si C < O."""
+        open_prices = ohlcv[:, 0]
+        close_prices = ohlcv[:, 3]
+        # Las máscaras booleanas se reinterpretan como int8 (0/1) sin copia: 1 = LONG, 2 = EXIT
+        return (close_prices > open_prices).view(np.int8) + 2 * (close_prices < open_prices).view(np.int8)
@@ -0,0 +1,216 @@
+"""
+Tests para BacktestEngine con componentes reales.
+"""
+
+import asyncio
+from collections import deque
+from typing import Deque, Optional
+
+import pandas as pd
+import pytest
+
+from backtest.engine import BacktestEngine
+from backtest.simulated_broker import SimulatedBroker
+from data.historic_csv_data_handler import HistoricCSVDataHandler
+from event_bus import BaseEventHandler, EventBus, EventHandlerRegistry
+from models import EventType, MarketEvent, StrategyConfig, TradingConfig
+from order_manager.simple_order_manager import SimpleOrderManager
+from portfolio import SimplePortfolio
+from sizing import FixedQuantitySizer
+from strategies.simple_price_strategy import SimplePriceStrategy
+
+
+def build_engine(
+        async_mode: bool = False,
+        max_history: int = 100,
+        recycle_events: bool = False,
+        events_queue: Optional[Deque[MarketEvent]] = None,
+) -> BacktestEngine:
+    """Ensambla un backtest completo sobre 4 barras: LONG, LONG (ignorada), EXIT, LONG."""
+    config = TradingConfig(strategy=StrategyConfig(name="simple_price_strategy"))
+    config.backtesting.async_mode = async_mode
+
+    df = pd.DataFrame({
+        'open': [100.0, 101.0, 103.0, 99.0],
+        'high': [102.0, 104.0, 104.0, 101.0],
+        'low': [99.0, 100.0, 98.0, 98.0],
+        'close': [101.0, 103.0, 99.0, 100.0],
+        'volume': [10.0, 11.0, 12.0, 13.0],
+    }, index=pd.date_range('2023-01-01', periods=4, freq='h'))
+
+    registry = EventHandlerRegistry()
+    event_bus = EventBus(registry, max_history=max_history, recycle_events=recycle_events)
+    data_handler = HistoricCSVDataHandler(events_queue, "BTCUSDT", df)
+
+    strategy = SimplePriceStrategy(name="SimplePrice", symbols=["BTCUSDT"], event_bus=event_bus)
+    portfolio = SimplePortfolio(event_bus=event_bus, data_handler=data_handler, initial_capital=10000.0)
+    order_manager = SimpleOrderManager(
+        event_bus=event_bus,
+        portfolio=portfolio,
+        data_handler=data_handler,
+        sizer=FixedQuantitySizer(default_quantity=1.0),
+    )
+    broker = SimulatedBroker(event_bus, config.backtesting.commission, data_handler)
+    for handler in (strategy, portfolio, order_manager, broker):
+        registry.register_handler(handler)
+
+    return BacktestEngine(
+        config=config,
+        data_handler=data_handler,
+        strategy=strategy,
+        portfolio=portfolio,
+        order_manager=order_manager,
+        broker=broker,
+        event_bus=event_bus,
+    )
+
+
+@pytest.mark.parametrize("max_history", [0, 100])
+def test_run_processes_all_bars(max_history):
+    engine = build_engine(max_history=max_history)
+
+    engine.run()
+
+    assert engine.data_handler.continue_backtest is False
+    # Compra a 101, venta a 99 y compra final a 100, con comisión del 0.1%
+    assert engine.portfolio.get_position_size("BTCUSDT") == pytest.approx(1.0)
+    assert engine.portfolio.get_current_cash() == pytest.approx(10000.0 - 101.101 + 98.901 - 100.1)
+
+    stats = engine.event_bus.get_stats()
+    # 4 MARKET + 3 SIGNAL (el segundo LONG repetido no se publica) + 3 ORDER + 3 FILL
+    assert stats['events_published'] == 13
+    assert stats['handler_errors'] == 0
+
+
+@pytest.mark.parametrize("async_mode", [False, True])
+def test_run_with_events_queue_publishes_each_bar_once(async_mode):
+    events_queue = deque()
+    engine = build_engine(async_mode=async_mode, events_queue=events_queue)
+
+    engine.run()
+
+    # Los MarketEvent se entregan sólo por la cola, que queda vacía al terminar
+    assert not events_queue
+    assert engine.portfolio.get_current_cash() == pytest.approx(10000.0 - 101.101 + 98.901 - 100.1)
+    assert engine.event_bus.get_stats()['events_published'] == 13
+
+
+class RetainingHandler(BaseEventHandler):
+    """Handler que conserva los MarketEvent recibidos."""
+
+    def __init__(self):
+        super().__init__("Retaining")
+        self.events = []
+
+    @property
+    def supported_events(self):
+        return {EventType.MARKET}
+
+    def handle(self, event):
+        self.events.append(event)
+
+
+def test_run_does_not_recycle_events_by_default():
+    engine = build_engine(max_history=0)
+    retaining = RetainingHandler()
+    engine.event_bus.registry.register_handler(retaining)
+
+    engine.run()
+
+    # Sin opt-in los eventos no se reutilizan: cada barra conserva su propio evento intacto
+    assert len({id(e) for e in retaining.events}) == 4
+    assert [e.timestamp for e in retaining.events] == list(pd.date_range('2023-01-01', periods=4, freq='h'))
+    assert all(e.data is not None for e in retaining.events)
+
+
+def test_run_recycles_events_only_when_enabled():
+    engine = build_engine(max_history=0, recycle_events=True)
+    retaining = RetainingHandler()
+    engine.event_bus.registry.register_handler(retaining)
+
+    engine.run()
+
+    assert len({id(e) for e in retaining.events}) == 1
+    assert engine.portfolio.get_current_cash() == pytest.approx(10000.0 - 101.101 + 98.901 - 100.1)
+
+
+def test_run_async_mode_publishes_every_bar():
+    engine = build_engine(async_mode=True)
+
+    engine.run()
+
+    assert engine.data_handler.continue_backtest is False
+    history = engine.event_bus.get_history()
+    market_events = [e for e in history if e.type == "MARKET"]
+    assert [e.timestamp for e in market_events] == list(pd.date_range('2023-01-01', periods=4, freq='h'))
+
+
+def test_run_async_mode_fills_at_published_bar_close():
+    sync_engine = build_engine()
+    async_engine = build_engine(async_mode=True)
+
+    sync_engine.run()
+    async_engine.run()
+
+    # El productor va una barra por delante: los fills deben usar el cierre de la barra publicada
+    assert async_engine.portfolio.get_current_cash() == pytest.approx(sync_engine.portfolio.get_current_cash())
+    assert async_engine.portfolio.get_current_cash() == pytest.approx(10000.0 - 101.101 + 98.901 - 100.1)
+    assert async_engine.portfolio.get_position_size("BTCUSDT") == pytest.approx(1.0)
+
+
+def test_run_async_mode_uses_loop_factory():
+    engine = build_engine(async_mode=True)
+    loops = []
+
+    def loop_factory():
+        loop = asyncio.new_event_loop()
+        loops.append(loop)
+        return loop
+
+    engine.loop_factory = loop_factory
+    engine.run()
+
+    assert len(loops) == 1
+    assert engine.data_handler.continue_backtest is False
+
+
+def test_produce_async_cancelled_with_full_queue_does_not_hang():
+    engine = build_engine(async_mode=True)
+
+    async def scenario():
+        pending = asyncio.Queue(maxsize=1)
+        producer = asyncio.create_task(engine._produce_async(pending))
+        # Sin consumidor la cola se llena y el productor queda bloqueado en put
+        while not pending.full():
+            await asyncio.sleep(0)
+        producer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(producer, timeout=1)
+        return pending.get_nowait()
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_run_vectorized_matches_per_bar_run():
+    engine = build_engine()
+
+    engine.run_vectorized()
+
+    assert engine.data_handler.continue_backtest is False
+    assert engine.portfolio.get_position_size("BTCUSDT") == pytest.approx(1.0)
+    assert engine.portfolio.get_current_cash() == pytest.approx(10000.0 - 101.101 + 98.901 - 100.1)
+
+    stats = engine.event_bus.get_stats()
+    # Sin MARKET: 3 SIGNAL + 3 ORDER + 3 FILL
+    assert stats['events_published'] == 9
+    assert stats['handler_errors'] == 0
+
+
+def test_run_vectorized_falls_back_without_compute_signals(monkeypatch):
+    engine = build_engine()
+    monkeypatch.setattr(engine.strategy, "compute_signals", lambda ohlcv: None)
+
+    engine.run_vectorized()
+
+    assert engine.portfolio.get_current_cash() == pytest.approx(10000.0 - 101.101 + 98.901 - 100.1)
+    assert engine.event_bus.get_stats()['events_published'] == 13
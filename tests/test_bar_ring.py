@@ -0,0 +1,50 @@
+"""
+Tests para el buffer circular de barras de las estrategias.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from strategies.bar_ring import BarRing
+
+
+START = datetime(2023, 1, 1)
+
+
+def make_bar(i: int) -> dict:
+    return {"open": float(i), "close": float(i) + 0.5, "volume": 10, "datetime": START + timedelta(minutes=i), "note": "x"}
+
+
+def test_bar_ring_keeps_numeric_columns_in_order():
+    ring = BarRing.for_bar(make_bar(0), capacity=4)
+    for i in range(3):
+        ring.append(START + timedelta(minutes=i), make_bar(i))
+
+    df = ring.to_frame()
+    assert list(df.columns) == ["open", "close", "volume"]
+    assert df.index.name == "timestamp"
+    assert list(df["open"]) == [0.0, 1.0, 2.0]
+    assert df.index[-1] == START + timedelta(minutes=2)
+
+
+def test_bar_ring_overwrites_oldest_and_limits_periods():
+    ring = BarRing(["open", "close"], capacity=3)
+    for i in range(5):
+        ring.append(START + timedelta(minutes=i), make_bar(i))
+
+    assert len(ring) == 3
+    assert list(ring.to_frame()["open"]) == [2.0, 3.0, 4.0]
+    assert list(ring.to_frame(periods=2)["open"]) == [3.0, 4.0]
+
+
+def test_bar_ring_missing_column_is_nan():
+    ring = BarRing(["open", "close"], capacity=2)
+    ring.append(START, {"open": 1.0})
+    assert np.isnan(ring.to_frame()["close"].iloc[0])
+
+
+def test_bar_ring_rejects_non_positive_capacity():
+    with pytest.raises(ValueError):
+        BarRing(["open"], capacity=0)
@@ -118,6 +118,28 @@ class TestConfigModels:
         with pytest.raises(ValidationError):
             BacktestingConfig(initial_capital=-100.0)
 
+    def test_market_ring_capacity_validation(self):
+        """Test que la capacidad del buffer de tickers debe ser una potencia de 2 positiva."""
+        from models.config import ExchangeSettings
+
+        assert ExchangeSettings(market_ring_capacity=256).market_ring_capacity == 256
+
+        for capacity in (0, -4, 1000):
+            with pytest.raises(ValidationError):
+                ExchangeSettings(market_ring_capacity=capacity)
+
+    def test_csv_file_pattern_regex(self):
+        """Test que el patrón de ficheros CSV se compila una vez y sigue a file_pattern."""
+        from models.config import CSVDataSourceSettings
+
+        settings = CSVDataSourceSettings(file_pattern="BTCUSDT-*.csv")
+        assert settings.file_pattern_regex is CSVDataSourceSettings(file_pattern="BTCUSDT-*.csv").file_pattern_regex
+        assert settings.file_pattern_regex.match("BTCUSDT-1h-2023-01.csv")
+        assert not settings.file_pattern_regex.match("ETHUSDT-1h-2023-01.csv")
+
+        settings.file_pattern = "*.txt"
+        assert settings.file_pattern_regex.match("notas.txt")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
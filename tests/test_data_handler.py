@@ -1,6 +1,6 @@
 import pytest
 import pandas as pd
-from queue import Queue
+from collections import deque
 from models.events import MarketEvent
 from data.historic_csv_data_handler import HistoricCSVDataHandler
 
@@ -15,14 +15,15 @@ def test_historic_csv_data_handler_basic():
         'datetime': [pd.Timestamp('2023-01-01'), pd.Timestamp('2023-01-02')]
     })
     df.set_index('datetime', inplace=True)
-    queue = Queue()
+    queue = deque()
     handler = HistoricCSVDataHandler(queue, symbol="BTCUSDT", data_frame=df)
     assert handler.symbol == "BTCUSDT"
+    assert handler.uses_events_queue is True
     assert handler.continue_backtest is True
     handler.update_bars()
     assert len(handler.latest_symbol_data) == 1
-    assert not queue.empty()
-    event = queue.get()
+    assert queue
+    event = queue.popleft()
     assert isinstance(event, MarketEvent)
     handler.update_bars()
     assert len(handler.latest_symbol_data) == 2
@@ -30,3 +31,52 @@ def test_historic_csv_data_handler_basic():
     assert handler.continue_backtest is False
     bars = handler.get_latest_bars(2)
     assert len(bars) == 2
+
+def test_historic_csv_data_handler_latest_price():
+    df = pd.DataFrame({
+        'open': [1.0, 2.0],
+        'close': [1.5, 2.5],
+    }, index=pd.to_datetime(['2023-01-01', '2023-01-02']))
+    queue = deque()
+    handler = HistoricCSVDataHandler(queue, symbol="BTCUSDT", data_frame=df)
+    assert handler.get_latest_price("BTCUSDT") is None
+    handler.update_bars()
+    event = queue.popleft()
+    assert event.data == {'open': 1.0, 'close': 1.5, 'datetime': pd.Timestamp('2023-01-01')}
+    handler.update_bars()
+    assert handler.get_latest_price("BTCUSDT") == 2.5
+    assert handler.get_latest_price("ETHUSDT") is None
+
+def test_historic_csv_data_handler_returns_events_without_queue():
+    df = pd.DataFrame({
+        'open': [1.0, 2.0],
+        'close': [1.5, 2.5],
+    }, index=pd.to_datetime(['2023-01-01', '2023-01-02']))
+    handler = HistoricCSVDataHandler(None, symbol="BTCUSDT", data_frame=df)
+    assert handler.uses_events_queue is False
+    first = handler.update_bars()
+    assert isinstance(first, MarketEvent)
+    assert first.timestamp == pd.Timestamp('2023-01-01')
+    second = handler.update_bars()
+    assert second.data['close'] == 2.5
+    assert handler.update_bars() is None
+    assert handler.continue_backtest is False
+
+def test_historic_csv_data_handler_from_loader_iter():
+    index = pd.date_range('2023-01-01', periods=5, freq='D')
+    df = pd.DataFrame({'open': [1.0] * 5, 'close': [1.5, 2.5, 3.5, 4.5, 5.5]}, index=index)
+    chunks = [df.iloc[:2], df.iloc[2:2], df.iloc[2:4], df.iloc[4:]]
+    handler = HistoricCSVDataHandler.from_loader_iter(None, "BTCUSDT", chunks, lookback=1)
+
+    timestamps = []
+    while handler.continue_backtest:
+        event = handler.update_bars()
+        if event is not None:
+            timestamps.append(event.timestamp)
+            bars = handler.get_latest_bars(2)
+
+    assert timestamps == list(index)
+    # Tras cambiar de bloque sólo se conservan lookback barras anteriores
+    assert [bar['close'] for bar in bars] == [4.5, 5.5]
+    assert handler.get_latest_price("BTCUSDT") == 5.5
+    assert handler.get_ohlcv_array(['open', 'close']) is None
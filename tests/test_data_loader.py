@@ -19,3 +19,126 @@ def test_binance_csv_loader(tmp_path):
     assert df.shape[0] == 2
     assert df.index[0] == pd.Timestamp("2023-01-01 00:00:00")
     assert df["open"].iloc[0] == 1
+
+def test_binance_csv_loader_dtypes_and_missing_column(tmp_path):
+    csv_content = """openTime,open,high,low,close,volume,closeTime,quoteAssetVolume,numberOfTrades,ignore
+1672531200000,1,2,0,1.5,100,1672534800000,150,10,0
+"""
+    csv_file = tmp_path / "binance.csv"
+    csv_file.write_text(csv_content)
+    df = BinanceCSVLoader().load(csv_file)
+    assert df.index.name == "open_time"
+    assert "ignore" not in df.columns
+    assert all(dtype == "float64" for dtype in df.dtypes)
+
+    missing_close = tmp_path / "missing.csv"
+    missing_close.write_text("openTime,open,high,low,volume,closeTime,quoteAssetVolume,numberOfTrades\n1672531200000,1,2,0,100,1672534800000,150,10\n")
+    with pytest.raises(ValueError, match="close"):
+        BinanceCSVLoader().load(missing_close)
+
+def test_binance_csv_loader_float32_dtype(tmp_path):
+    csv_file = tmp_path / "binance.csv"
+    csv_file.write_text("openTime,open,high,low,close,volume,closeTime,quoteAssetVolume,numberOfTrades\n1672531200000,1,2,0,1.5,100,1672534800000,150,10\n")
+    df = BinanceCSVLoader(float_dtype="float32").load(csv_file)
+    assert all(dtype == "float32" for dtype in df.dtypes)
+    assert df["close"].iloc[0] == 1.5
+
+def test_binance_csv_loader_drops_rows_with_missing_markers(tmp_path):
+    csv_content = """openTime,open,high,low,close,volume,closeTime,quoteAssetVolume,numberOfTrades
+1672531200000,1,2,0,1.5,100,1672534800000,150,10
+1672617600000,2,3,1,-,200,1672621200000,250,20
+"""
+    csv_file = tmp_path / "binance.csv"
+    csv_file.write_text(csv_content)
+    df = BinanceCSVLoader().load(csv_file)
+    assert df.shape[0] == 1
+    assert df["close"].iloc[0] == 1.5
+
+def test_binance_csv_loader_drops_rows_with_non_numeric_cells(tmp_path):
+    csv_content = """openTime,open,high,low,close,volume,closeTime,quoteAssetVolume,numberOfTrades
+1672531200000,1,2,0,1.5,100,1672534800000,150,10
+1672617600000,2,3,1,abc,200,1672621200000,250,20
+,3,4,2,3.5,300,1672707600000,350,30
+1672790400000,4,5,3,4.5,400,1672794000000,450,40
+"""
+    csv_file = tmp_path / "binance.csv"
+    csv_file.write_text(csv_content)
+    loader = BinanceCSVLoader()
+
+    df = loader.load(csv_file)
+    assert list(df["close"]) == [1.5, 4.5]
+    assert list(df.index) == [pd.Timestamp("2023-01-01"), pd.Timestamp("2023-01-04")]
+    assert all(dtype == "float64" for dtype in df.dtypes)
+
+    chunks = list(loader.load_iter(csv_file, chunksize=1))
+    assert pd.concat(chunks).equals(df)
+
+    # Sólo el tiempo vacío: la lectura con tipos lo deja como NaN y la fila se descarta
+    empty_time = tmp_path / "empty_time.csv"
+    empty_time.write_text(csv_content.replace("1672617600000,2,3,1,abc", "1672617600000,2,3,1,2.5"))
+    assert list(loader.load(empty_time)["close"]) == [1.5, 2.5, 4.5]
+
+
+def test_binance_csv_loader_load_iter_yields_normalized_chunks(tmp_path):
+    csv_content = """openTime,open,high,low,close,volume,closeTime,quoteAssetVolume,numberOfTrades
+1672531200000,1,2,0,1.5,100,1672534800000,150,10
+1672617600000,2,3,1,2.5,200,1672621200000,250,20
+1672704000000,3,4,2,3.5,300,1672707600000,350,30
+"""
+    csv_file = tmp_path / "binance.csv"
+    csv_file.write_text(csv_content)
+    chunks = list(BinanceCSVLoader().load_iter(csv_file, chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[1].index[0] == pd.Timestamp("2023-01-03 00:00:00")
+    assert pd.concat(chunks).equals(BinanceCSVLoader().load(csv_file))
+
+def test_binance_csv_loader_reads_only_selected_columns(tmp_path):
+    csv_content = """openTime,open,high,low,close,volume,closeTime,quoteAssetVolume,numberOfTrades
+1672531200000,1,2,0,1.5,100,1672534800000,150,10
+"""
+    csv_file = tmp_path / "binance.csv"
+    csv_file.write_text(csv_content)
+    df = BinanceCSVLoader(columns=["open", "high", "low", "close", "volume"]).load(csv_file)
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert df.index.name == "open_time"
+    assert df["close"].iloc[0] == 1.5
+
+    with pytest.raises(ValueError, match="desconocidas"):
+        BinanceCSVLoader(columns=["bid"])
+
+def test_binance_csv_loader_load_many_concatenates_in_order(tmp_path):
+    header = "openTime,open,high,low,close,volume,closeTime,quoteAssetVolume,numberOfTrades\n"
+    first = tmp_path / "a.csv"
+    first.write_text(header + "1672531200000,1,2,0,1.5,100,1672534800000,150,10\n")
+    second = tmp_path / "b.csv"
+    second.write_text(header + "1672617600000,2,3,1,2.5,200,1672621200000,250,20\n")
+    df = BinanceCSVLoader().load_many([first, second])
+    assert list(df["close"]) == [1.5, 2.5]
+
+    broken = tmp_path / "broken.csv"
+    broken.write_text("openTime,open\n1672531200000,1\n")
+    with pytest.raises(ValueError, match="broken.csv"):
+        BinanceCSVLoader().load_many([first, broken])
+
+def test_binance_csv_loader_load_cached_reuses_parsed_frame(tmp_path, monkeypatch):
+    csv_file = tmp_path / "binance.csv"
+    csv_file.write_text(
+        "openTime,open,high,low,close,volume,closeTime,quoteAssetVolume,numberOfTrades\n"
+        "1672531200000,1,2,0,1.5,100,1672534800000,150,10\n"
+    )
+    loader = BinanceCSVLoader(cache_dir=tmp_path / "cache")
+    first = loader.load_cached(csv_file)
+    assert len(list((tmp_path / "cache").glob("*.npz"))) == 1
+
+    def fail_load(path):
+        raise AssertionError("El CSV no debería volver a parsearse")
+
+    monkeypatch.setattr(loader, "load", fail_load)
+    cached = loader.load_cached(csv_file)
+    assert cached.equals(first)
+    assert cached.index.name == "open_time"
+    assert cached.index.dtype == first.index.dtype
+
+    # Otro mapeo de columnas no reutiliza la misma entrada
+    subset = BinanceCSVLoader(columns=["close"], cache_dir=tmp_path / "cache").load_cached(csv_file)
+    assert list(subset.columns) == ["close"]
@@ -19,3 +19,14 @@ def test_order_type_enum():
 def test_order_direction_enum():
     assert OrderDirection.BUY == "BUY"
     assert OrderDirection.SELL == "SELL"
+
+def test_enums_reexported_from_single_module():
+    # Las comparaciones por identidad del camino de eventos requieren un único módulo de enums
+    import models
+    import models.events
+    import models.exchange_state
+
+    assert models.SignalType is SignalType
+    assert models.OrderDirection is OrderDirection
+    assert models.events.SignalType is SignalType
+    assert models.exchange_state.OrderDirection is OrderDirection
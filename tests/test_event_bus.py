@@ -19,14 +19,16 @@ class MockEventHandler(BaseEventHandler):
         super().__init__(name)
         self._supported_event_types = supported_event_types
         self.events_received = []
-        self.call_count = 0
         
     @property
     def supported_events(self):
         return self._supported_event_types
+
+    @property
+    def call_count(self):
+        return len(self.events_received)
     
     def handle(self, event):
-        self.call_count += 1
         self.events_received.append(event)
 
 
@@ -172,6 +174,20 @@ class TestEventBus:
         assert stats['handlers_executed'] == 1  # Solo el handler bueno
         assert stats['handler_errors'] == 1     # El handler malo falló
     
+    def test_single_handler_error_tolerance(self):
+        """Test que el camino rápido de un único handler también aísla errores."""
+        self.registry.register_handler(FaultyHandler())
+        
+        event = MarketEvent(symbol="BTCUSDT", timestamp=datetime.now())
+        
+        # Act - no debe lanzar excepción
+        self.event_bus.publish(event)
+        
+        stats = self.event_bus.get_stats()
+        assert stats['events_published'] == 1
+        assert stats['handlers_executed'] == 0
+        assert stats['handler_errors'] == 1
+    
     def test_event_history_disabled(self):
         """Test EventBus sin historial (max_history=0)."""
         bus = EventBus(self.registry, max_history=0)
@@ -182,6 +198,12 @@ class TestEventBus:
         assert bus.get_history() == []
         assert bus.get_stats()['max_history'] == 0
     
+    def test_recycle_events_is_opt_in(self):
+        """Test que el reciclado de eventos requiere opt-in y se anula con historial."""
+        assert EventBus(self.registry).recycle_events is False
+        assert EventBus(self.registry, recycle_events=True).recycle_events is True
+        assert EventBus(self.registry, max_history=5, recycle_events=True).recycle_events is False
+    
     def test_event_history_enabled(self):
         """Test EventBus con historial habilitado."""
         bus = EventBus(self.registry, max_history=3)
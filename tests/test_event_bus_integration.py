@@ -2,7 +2,7 @@
 Tests de integración para EventBus con componentes reales.
 """
 
-from queue import Queue
+from collections import deque
 from datetime import datetime
 import pandas as pd
 
@@ -26,7 +26,7 @@ class SimpleStrategyHandler(BaseEventHandler):
         return {EventType.MARKET}
     
     def handle(self, event):
-        if isinstance(event, MarketEvent) and event.data:
+        if event.data:
             close = event.data.get('close', 0)
             open_price = event.data.get('open', 0)
             
@@ -53,7 +53,7 @@ def test_eventbus_with_data_handler_integration():
     }, index=pd.to_datetime(['2023-01-01', '2023-01-02']))
     
     # Setup componentes
-    queue = Queue()
+    queue = deque()
     data_handler = HistoricCSVDataHandler(queue, "BTCUSDT", df)
     
     registry = EventHandlerRegistry()
@@ -69,8 +69,8 @@ def test_eventbus_with_data_handler_integration():
         data_handler.update_bars()
         
         # EventBus procesa eventos de la cola
-        while not queue.empty():
-            event = queue.get_nowait()
+        while queue:
+            event = queue.popleft()
             event_bus.publish(event)  # EventBus dispatch
         
         events_processed += 1
@@ -162,7 +162,7 @@ def test_eventbus_no_signal_generation():
     }, index=pd.to_datetime(['2023-01-01', '2023-01-02']))
     
     # Setup componentes
-    queue = Queue()
+    queue = deque()
     data_handler = HistoricCSVDataHandler(queue, "BTCUSDT", df)
     
     registry = EventHandlerRegistry()
@@ -176,8 +176,8 @@ def test_eventbus_no_signal_generation():
     while data_handler.continue_backtest and events_processed < 5:
         data_handler.update_bars()
         
-        while not queue.empty():
-            event = queue.get_nowait()
+        while queue:
+            event = queue.popleft()
             event_bus.publish(event)
         
         events_processed += 1
@@ -205,7 +205,7 @@ def test_eventbus_multiple_strategies():
         'volume': [1000.0]
     }, index=[pd.Timestamp('2023-01-01')])
     
-    queue = Queue()
+    queue = deque()
     data_handler = HistoricCSVDataHandler(queue, "BTCUSDT", df)
     
     registry = EventHandlerRegistry()
@@ -225,7 +225,7 @@ def test_eventbus_multiple_strategies():
             return {EventType.MARKET}
         
         def handle(self, event):
-            if isinstance(event, MarketEvent) and event.data:
+            if event.data:
                 # Estrategia diferente: SHORT si volume > 500
                 volume = event.data.get('volume', 0)
                 if volume > 500:
@@ -244,8 +244,8 @@ def test_eventbus_multiple_strategies():
     
     # Procesar datos
     data_handler.update_bars()
-    while not queue.empty():
-        event = queue.get_nowait()
+    while queue:
+        event = queue.popleft()
         event_bus.publish(event)
     
     # Assert: ambas estrategias generaron señales
@@ -72,10 +72,26 @@ def test_unregister_handler_across_events():
     for et in (EventType.MARKET, EventType.SIGNAL, EventType.FILL):
         assert not reg.has_handlers(et)
 
-def test_get_handlers_for_empty_event_raises():
+def test_get_handlers_for_empty_event_returns_empty_tuple():
+    reg = EventHandlerRegistry()
+    assert reg.get_handlers(EventType.ORDER) == ()
+
+def test_get_handlers_strict_for_empty_event_raises():
     reg = EventHandlerRegistry()
     with pytest.raises(HandlerNotFoundError):
-        reg.get_handlers(EventType.ORDER)
+        reg.get_handlers_strict(EventType.ORDER)
+
+def test_get_handlers_cache_follows_registration():
+    reg = EventHandlerRegistry()
+    h1, h2 = HMarket(), HMarket()
+    reg.register_handler(h1)
+    assert reg.get_handlers(EventType.MARKET) == (h1,)
+    reg.register_handler(h2)
+    assert reg.get_handlers(EventType.MARKET) == (h1, h2)
+    reg.unregister_handler(h1)
+    assert reg.get_handlers(EventType.MARKET) == (h2,)
+    reg.clear()
+    assert reg.get_handlers(EventType.MARKET) == ()
 
 def test_clear_registry():
     reg = EventHandlerRegistry()
@@ -97,3 +113,14 @@ def test_registry_str_contains_registered_classes():
     assert "MARKET" in s
     assert "HMarket" in s
     assert "HMulti" in s
+
+def test_get_single_handler_only_for_single_registration():
+    reg = EventHandlerRegistry()
+    h1, h2 = HMarket(), HMarket()
+    assert reg.get_single_handler(EventType.MARKET) is None
+    reg.register_handler(h1)
+    assert reg.get_single_handler(EventType.MARKET) is h1
+    reg.register_handler(h2)
+    assert reg.get_single_handler(EventType.MARKET) is None
+    reg.unregister_handler(h1)
+    assert reg.get_single_handler(EventType.MARKET) is h2
@@ -2,13 +2,12 @@
 Test de integración: HistoricCSVDataHandler → MarketEvent → EventHandlerRegistry → Handler
 """
 
-from queue import Queue
+from collections import deque
 from datetime import datetime
 import pandas as pd
 
 from data.historic_csv_data_handler import HistoricCSVDataHandler
 from event_bus.handlers import EventHandlerRegistry, BaseEventHandler
-from models.events import MarketEvent
 from models.enums import EventType
 
 
@@ -25,13 +24,12 @@ class SimpleMarketEventCounter(BaseEventHandler):
         return {EventType.MARKET}
     
     def handle(self, event):
-        if isinstance(event, MarketEvent):
-            self.count += 1
-            self.events_received.append({
-                'symbol': event.symbol,
-                'timestamp': event.timestamp,
-                'has_data': event.data is not None
-            })
+        self.count += 1
+        self.events_received.append({
+            'symbol': event.symbol,
+            'timestamp': event.timestamp,
+            'has_data': event.data is not None
+        })
 
 
 def test_data_handler_to_registry_integration():
@@ -48,7 +46,7 @@ def test_data_handler_to_registry_integration():
     }, index=pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-03']))
     
     # Setup componentes
-    events_queue = Queue()
+    events_queue = deque()
     data_handler = HistoricCSVDataHandler(events_queue, "BTCUSDT", df)
     
     registry = EventHandlerRegistry()
@@ -56,17 +54,17 @@ def test_data_handler_to_registry_integration():
     registry.register_handler(market_counter)
     
     # Act: Procesar todas las barras
+    # Sólo se emiten MarketEvent: los manejadores se resuelven una vez fuera del bucle
+    market_handlers = registry.get_handlers(EventType.MARKET)
     processed_events = 0
     while data_handler.continue_backtest and processed_events < 5:  # safety limit
         data_handler.update_bars()
         
         # Simular Event Bus: procesar eventos en la cola
-        while not events_queue.empty():
-            event = events_queue.get_nowait()
-            if registry.has_handlers(event.type):
-                handlers = registry.get_handlers(event.type)
-                for handler in handlers:
-                    handler.handle(event)
+        while events_queue:
+            event = events_queue.popleft()
+            for handler in market_handlers:
+                handler.handle(event)
         
         processed_events += 1
     
@@ -95,7 +93,7 @@ def test_multiple_handlers_same_event():
         'volume': [1000.0]
     }, index=[pd.Timestamp('2023-01-01')])
     
-    events_queue = Queue()
+    events_queue = deque()
     data_handler = HistoricCSVDataHandler(events_queue, "ETHUSD", df)
     
     registry = EventHandlerRegistry()
@@ -109,7 +107,7 @@ def test_multiple_handlers_same_event():
     data_handler.update_bars()
     
     # Procesar evento con ambos handlers
-    event = events_queue.get_nowait()
+    event = events_queue.popleft()
     handlers = registry.get_handlers(event.type)
     for handler in handlers:
         handler.handle(event)
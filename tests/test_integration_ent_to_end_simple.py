@@ -2,14 +2,14 @@
 Test de integración end-to-end simple: Data → Signal → Order (simulado)
 """
 
-from queue import Queue
+from collections import deque
 from datetime import datetime
 from typing import Optional
 import pandas as pd
 
 from data.historic_csv_data_handler import HistoricCSVDataHandler
 from event_bus.handlers import EventHandlerRegistry, BaseEventHandler
-from models.events import MarketEvent, SignalEvent, OrderEvent
+from models.events import SignalEvent, OrderEvent
 from models.enums import EventType, SignalType, OrderType, OrderDirection
 
 
@@ -19,14 +19,14 @@ class SimpleStrategyHandler(BaseEventHandler):
     def __init__(self):
         super().__init__("SimpleStrategy")
         self.signals_generated = []
-        self.events_queue: Optional[Queue[SignalEvent]] = None  # Se asignará externamente
+        self.events_queue: Optional[deque] = None  # Se asignará externamente
     
     @property
     def supported_events(self):
         return {EventType.MARKET}
     
     def handle(self, event):
-        if isinstance(event, MarketEvent) and event.data:
+        if event.data:
             open_price = event.data.get('open', 0)
             close_price = event.data.get('close', 0)
             
@@ -40,8 +40,8 @@ class SimpleStrategyHandler(BaseEventHandler):
                 self.signals_generated.append(signal)
                 
                 # En un sistema real, esto iría al Event Bus
-                if self.events_queue:
-                    self.events_queue.put(signal)
+                if self.events_queue is not None:
+                    self.events_queue.append(signal)
 
 
 class SimpleOrderHandler(BaseEventHandler):
@@ -56,18 +56,17 @@ class SimpleOrderHandler(BaseEventHandler):
         return {EventType.SIGNAL}
     
     def handle(self, event):
-        if isinstance(event, SignalEvent):
-            # Convertir señal a orden
-            direction = OrderDirection.BUY if event.signal_type == SignalType.LONG else OrderDirection.SELL
-            
-            order = OrderEvent(
-                symbol=event.symbol,
-                timestamp=event.timestamp,
-                order_type=OrderType.MARKET,
-                quantity=0.1,
-                direction=direction
-            )
-            self.orders_created.append(order)
+        # Convertir señal a orden
+        direction = OrderDirection.BUY if event.signal_type == SignalType.LONG else OrderDirection.SELL
+        
+        order = OrderEvent(
+            symbol=event.symbol,
+            timestamp=event.timestamp,
+            order_type=OrderType.MARKET,
+            quantity=0.1,
+            direction=direction
+        )
+        self.orders_created.append(order)
 
 
 def test_end_to_end_data_to_orders():
@@ -84,7 +83,7 @@ def test_end_to_end_data_to_orders():
     }, index=pd.to_datetime(['2023-01-01', '2023-01-02']))
     
     # Setup componentes
-    events_queue = Queue()
+    events_queue = deque()
     data_handler = HistoricCSVDataHandler(events_queue, "BTCUSDT", df)
     
     registry = EventHandlerRegistry()
@@ -103,12 +102,11 @@ def test_end_to_end_data_to_orders():
         data_handler.update_bars()
         
         # Procesar todos los eventos en la cola
-        while not events_queue.empty():
-            event = events_queue.get_nowait()
-            if registry.has_handlers(event.type):
-                handlers = registry.get_handlers(event.type)
-                for handler in handlers:
-                    handler.handle(event)
+        while events_queue:
+            event = events_queue.popleft()
+            # get_handlers devuelve una tupla vacía si no hay manejadores
+            for handler in registry.get_handlers(event.type):
+                handler.handle(event)
         
         events_processed += 1
     
@@ -140,7 +138,7 @@ def test_no_signals_when_close_not_greater_than_open():
         'volume': [1000.0, 1100.0]
     }, index=pd.to_datetime(['2023-01-01', '2023-01-02']))
     
-    events_queue = Queue()
+    events_queue = deque()
     data_handler = HistoricCSVDataHandler(events_queue, "BTCUSDT", df)
     
     registry = EventHandlerRegistry()
@@ -151,12 +149,11 @@ def test_no_signals_when_close_not_greater_than_open():
     # Act
     while data_handler.continue_backtest:
         data_handler.update_bars()
-        while not events_queue.empty():
-            event = events_queue.get_nowait()
-            if registry.has_handlers(event.type):
-                handlers = registry.get_handlers(event.type)
-                for handler in handlers:
-                    handler.handle(event)
+        while events_queue:
+            event = events_queue.popleft()
+            # get_handlers devuelve una tupla vacía si no hay manejadores
+            for handler in registry.get_handlers(event.type):
+                handler.handle(event)
     
     # Assert: No signals generated
     assert len(strategy.signals_generated) == 0
@@ -0,0 +1,19 @@
+"""
+Tests para las utilidades de arranque de main.
+"""
+
+from main import find_csv_files
+from models.config import CSVDataSourceSettings
+
+
+def test_find_csv_files_skips_hidden_files(tmp_path):
+    for name in ("BTCUSDT-1h.csv", ".BTCUSDT-1h.csv", "notas.txt"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "sub.csv").mkdir()
+
+    files = find_csv_files(tmp_path, CSVDataSourceSettings(data_path=str(tmp_path), file_pattern="*.csv"))
+    assert [path.name for path in files] == ["BTCUSDT-1h.csv"]
+
+    # Un patrón que empieza por punto selecciona explícitamente los ficheros ocultos
+    hidden = find_csv_files(tmp_path, CSVDataSourceSettings(data_path=str(tmp_path), file_pattern=".*.csv"))
+    assert [path.name for path in hidden] == [".BTCUSDT-1h.csv"]
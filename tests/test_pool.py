@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from models.enums import EventType, OrderDirection
+from models.events import FillEvent, MarketEvent
+from models.exchange_state import Ticker
+from models.pool import (
+    acquire_fill_event,
+    acquire_market_event,
+    acquire_ticker,
+    release_fill_event,
+    release_market_event,
+    release_ticker,
+)
+
+
+def test_market_event_is_reused_after_release():
+    first = acquire_market_event("BTCUSDT", datetime(2023, 1, 1), {"close": 1.0})
+    assert isinstance(first, MarketEvent)
+    release_market_event(first)
+    assert first.data is None
+
+    second = acquire_market_event("ETHUSDT", datetime(2023, 1, 2), {"close": 2.0})
+    assert second is first
+    assert second.type == EventType.MARKET
+    assert second.symbol == "ETHUSDT"
+    assert second.timestamp == datetime(2023, 1, 2)
+    assert second.data == {"close": 2.0}
+
+
+def test_fill_event_is_reused_after_release():
+    kwargs = dict(
+        timestamp=datetime(2023, 1, 1),
+        symbol="BTCUSDT",
+        exchange="SIMULATED",
+        quantity=0.1,
+        direction=OrderDirection.BUY,
+        fill_cost=100.0,
+        commission=0.1,
+    )
+    first = acquire_fill_event(**kwargs)
+    assert isinstance(first, FillEvent)
+    release_fill_event(first)
+
+    second = acquire_fill_event(**{**kwargs, "direction": OrderDirection.SELL, "fill_cost": 200.0})
+    assert second is first
+    assert second.direction == OrderDirection.SELL
+    assert second.fill_cost == 200.0
+    assert second.commission == 0.1
+
+
+def test_ticker_is_reused_after_release():
+    first = acquire_ticker("BTCUSDT", 1, 100.0, 99.0, 101.0, 10.0)
+    assert isinstance(first, Ticker)
+    release_ticker(first)
+
+    second = acquire_ticker("ETHUSDT", 2, 200.0, 199.0, 201.0, 20.0)
+    assert second is first
+    assert second.symbol == "ETHUSDT"
+    assert (second.timestamp, second.last, second.bid, second.ask, second.volume) == (2, 200.0, 199.0, 201.0, 20.0)
@@ -0,0 +1,57 @@
+"""
+Tests para el buffer circular de tickers.
+"""
+
+import pytest
+
+from exchange import TickerRing
+from models.exchange_state import Ticker
+
+
+def make_ticker(timestamp: int) -> Ticker:
+    return Ticker(symbol="BTCUSDT", timestamp=timestamp, last=1.0, bid=1.0, ask=1.0, volume=1.0)
+
+
+def test_ring_preserves_order():
+    ring = TickerRing(4)
+    for ts in range(3):
+        ring.push(make_ticker(ts))
+
+    assert len(ring) == 3
+    assert ring.pop().timestamp == 0
+    assert [t.timestamp for t in ring.drain()] == [1, 2]
+    assert ring.pop() is None
+
+
+def test_ring_drops_oldest_when_full():
+    ring = TickerRing(4)
+    for ts in range(6):
+        ring.push(make_ticker(ts))
+
+    assert len(ring) == 4
+    assert ring.dropped == 2
+    assert [t.timestamp for t in ring.drain()] == [2, 3, 4, 5]
+
+
+def test_ring_consumer_skips_slots_overwritten_after_partial_read():
+    ring = TickerRing(4)
+    for ts in range(4):
+        ring.push(make_ticker(ts))
+    assert ring.pop().timestamp == 0
+
+    # El productor da la vuelta sin mover la posición de lectura del consumidor
+    for ts in range(4, 9):
+        ring.push(make_ticker(ts))
+    assert ring._tail == 1
+
+    assert len(ring) == 4
+    assert ring.pop().timestamp == 5
+    assert ring.dropped == 4
+    assert [t.timestamp for t in ring.drain()] == [6, 7, 8]
+    assert ring.dropped == 4
+
+
+@pytest.mark.parametrize("capacity", [0, 3, 100])
+def test_ring_requires_power_of_two(capacity):
+    with pytest.raises(ValueError):
+        TickerRing(capacity)
@@ -0,0 +1,49 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from models import FillEvent
+from models.enums import OrderDirection
+from portfolio import SimplePortfolio
+
+
+def make_fill(direction, quantity=1.0, fill_cost=100.0, commission=0.1):
+    return FillEvent(
+        timestamp=datetime(2023, 1, 1),
+        symbol="BTCUSDT",
+        exchange="SIMULATED",
+        quantity=quantity,
+        direction=direction,
+        fill_cost=fill_cost,
+        commission=commission,
+    )
+
+
+@pytest.fixture
+def portfolio():
+    return SimplePortfolio(event_bus=Mock(), data_handler=Mock(), initial_capital=1000.0)
+
+
+def test_buy_and_sell_fills_update_position_and_cash(portfolio):
+    portfolio.handle(make_fill(OrderDirection.BUY))
+    portfolio.handle(make_fill(OrderDirection.SELL, quantity=0.5, fill_cost=60.0))
+
+    assert portfolio.get_position_size("BTCUSDT") == pytest.approx(0.5)
+    assert portfolio.get_current_cash() == pytest.approx(1000.0 - 100.1 + 59.9)
+    assert portfolio.fill_count == 2
+
+
+def test_string_direction_is_booked_by_value(portfolio):
+    # Los eventos ya no se validan: "BUY" equivale a OrderDirection.BUY, no a una venta
+    portfolio.handle(make_fill("BUY"))
+
+    assert portfolio.get_position_size("BTCUSDT") == pytest.approx(1.0)
+
+
+def test_unknown_direction_is_skipped(portfolio):
+    portfolio.handle(make_fill("HOLD"))
+
+    assert portfolio.get_position_size("BTCUSDT") == 0.0
+    assert portfolio.get_current_cash() == 1000.0
+    assert portfolio.fill_count == 0
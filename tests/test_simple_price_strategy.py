@@ -1,11 +1,13 @@
 # tests/test_simple_price_strategy.py
 
+import numpy as np
 import pytest
 from datetime import datetime
 from unittest.mock import Mock
 
 from strategies.simple_price_strategy import SimplePriceStrategy
 from models import MarketEvent, SignalType, SignalEvent
+from strategies.base_strategy import OHLCV_COLUMNS, SIGNAL_CODES
 
 @pytest.fixture
 def mock_event_bus():
@@ -116,4 +118,40 @@ def test_handle_market_event_wrong_symbol(strategy, mock_event_bus):
     strategy.handle(market_event)
 
     # Verificar que NO se llamó a publish
-    mock_event_bus.publish.assert_not_called()
\ No newline at end of file
+    mock_event_bus.publish.assert_not_called()
+
+def test_repeated_signal_is_published_once(strategy, mock_event_bus):
+    """Verifica que una señal igual a la anterior para el símbolo no se vuelve a publicar."""
+    now = datetime.now()
+    for close in (105.0, 106.0):
+        strategy.handle(MarketEvent(symbol="BTCUSDT", timestamp=now, data={'open': 100.0, 'close': close}))
+
+    mock_event_bus.publish.assert_called_once()
+
+    strategy.handle(MarketEvent(symbol="BTCUSDT", timestamp=now, data={'open': 100.0, 'close': 95.0}))
+    assert mock_event_bus.publish.call_count == 2
+
+def test_repeated_signal_is_published_with_emit_duplicates(mock_event_bus):
+    """Verifica que con emit_duplicates se publica la señal en cada barra."""
+    strategy = SimplePriceStrategy(
+        name="TestSimplePrice", symbols=["BTCUSDT"], event_bus=mock_event_bus, parameters={'emit_duplicates': True}
+    )
+    now = datetime.now()
+    for close in (105.0, 106.0):
+        strategy.handle(MarketEvent(symbol="BTCUSDT", timestamp=now, data={'open': 100.0, 'close': close}))
+
+    assert mock_event_bus.publish.call_count == 2
+
+def test_compute_signals_matches_calculate_signal(strategy):
+    """Verifica que la versión vectorizada coincide con calculate_signal barra a barra."""
+    ohlcv = np.array([
+        [100.0, 110.0, 95.0, 105.0, 1000.0],
+        [100.0, 105.0, 90.0, 95.0, 1000.0],
+        [100.0, 105.0, 95.0, 100.0, 1000.0],
+    ])
+    codes = strategy.compute_signals(ohlcv)
+    expected = []
+    for row in ohlcv:
+        event = MarketEvent(symbol="BTCUSDT", timestamp=datetime.now(), data=dict(zip(OHLCV_COLUMNS, row)))
+        expected.append(strategy.calculate_signal(event))
+    assert [SIGNAL_CODES.get(int(code)) for code in codes] == expected
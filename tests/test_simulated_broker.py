@@ -0,0 +1,95 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from backtest.simulated_broker import SimulatedBroker
+from data.historic_csv_data_handler import HistoricCSVDataHandler
+from models import CommissionConfig, CommissionType, FillEvent, OrderEvent
+from models.enums import OrderDirection, OrderType
+
+
+@pytest.fixture
+def data_handler():
+    df = pd.DataFrame({
+        'open': [100.0],
+        'close': [200.0],
+    }, index=pd.to_datetime(['2023-01-01']))
+    handler = HistoricCSVDataHandler(None, "BTCUSDT", df)
+    handler.update_bars()
+    return handler
+
+
+def make_order(order_type=OrderType.MARKET, quantity=0.5):
+    return OrderEvent(
+        symbol="BTCUSDT",
+        timestamp=datetime(2023, 1, 1),
+        order_type=order_type,
+        quantity=quantity,
+        direction=OrderDirection.BUY,
+    )
+
+
+@pytest.mark.parametrize("commission_type, rate, expected", [
+    (CommissionType.PERCENTAGE, 0.001, 0.1),
+    (CommissionType.FIXED, 2.5, 2.5),
+])
+def test_market_order_fill_and_commission(data_handler, commission_type, rate, expected):
+    event_bus = Mock()
+    broker = SimulatedBroker(event_bus, CommissionConfig(type=commission_type, rate=rate), data_handler)
+
+    broker.handle(make_order())
+
+    event_bus.publish.assert_called_once()
+    fill = event_bus.publish.call_args[0][0]
+    assert isinstance(fill, FillEvent)
+    assert fill.fill_cost == pytest.approx(100.0)
+    assert fill.commission == pytest.approx(expected)
+    assert fill.exchange == "SIMULATED"
+
+
+def test_market_order_falls_back_to_latest_price():
+    # DataHandler que sólo implementa get_latest_price, sin current_symbol/current_close
+    data_handler = Mock(current_symbol=None, current_close=None)
+    data_handler.get_latest_price.return_value = 300.0
+    event_bus = Mock()
+    broker = SimulatedBroker(event_bus, CommissionConfig(rate=0.0), data_handler)
+
+    broker.handle(make_order())
+
+    data_handler.get_latest_price.assert_called_once_with("BTCUSDT")
+    fill = event_bus.publish.call_args[0][0]
+    assert fill.fill_cost == pytest.approx(150.0)
+
+
+def test_limit_order_is_ignored(data_handler):
+    event_bus = Mock()
+    broker = SimulatedBroker(event_bus, CommissionConfig(), data_handler)
+
+    broker.handle(make_order(order_type=OrderType.LIMIT))
+
+    event_bus.publish.assert_not_called()
+
+
+def test_order_without_market_data_is_not_filled():
+    df = pd.DataFrame({'close': [200.0]}, index=pd.to_datetime(['2023-01-01']))
+    handler = HistoricCSVDataHandler(None, "BTCUSDT", df)
+    event_bus = Mock()
+    broker = SimulatedBroker(event_bus, CommissionConfig(), handler)
+
+    # Aún no se ha emitido ninguna barra
+    broker.handle(make_order())
+
+    event_bus.publish.assert_not_called()
+
+
+def test_order_for_other_symbol_is_not_filled(data_handler):
+    event_bus = Mock()
+    broker = SimulatedBroker(event_bus, CommissionConfig(), data_handler)
+
+    order = make_order()
+    order.symbol = "ETHUSDT"
+    broker.handle(order)
+
+    event_bus.publish.assert_not_called()